@@ -2,27 +2,79 @@
 Authentication module for Car Rental System
 Handles user login, registration, and session management
 """
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict, Any
 from models import User
 from database import Database
 import hashlib
+import hmac
+import os
+import utils
+
+_sha256 = hashlib.sha256
+
+
+def _encode_password(password: str) -> bytes:
+    """Encode a password for hashing without failing on lone surrogates"""
+    return password.encode('utf-8', 'surrogatepass')
+
 
 class AuthManager:
+    # scrypt cost parameters for stored password hashes (~16 MB per derivation)
+    SCRYPT_PARAMS = {'n': 2 ** 14, 'r': 8, 'p': 1, 'dklen': 32}
+    
+    _instance: Optional['AuthManager'] = None
+    
     def __init__(self):
-        self.db = Database()
+        self.db = Database.get()
         self.current_user: Optional[User] = None
     
+    @classmethod
+    def get(cls) -> 'AuthManager':
+        """Get the shared AuthManager instance (holds the app session)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
     def hash_password(self, password: str) -> str:
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash password using SHA-256 (legacy unsalted records only)"""
+        return _sha256(_encode_password(password)).hexdigest()
+    
+    def derive_password_hash(self, password: str, salt: bytes) -> str:
+        """Derive a salted password hash using scrypt"""
+        return hashlib.scrypt(_encode_password(password), salt=salt, **self.SCRYPT_PARAMS).hex()
+    
+    def make_auth_record(self, email: str, password: str) -> Dict[str, Any]:
+        """Build an auth document with a fresh per-user salt"""
+        salt = os.urandom(16)
+        return {
+            'email': email,
+            'salt': salt.hex(),
+            'password_hash': self.derive_password_hash(password, salt)
+        }
+    
+    def verify_password(self, password: str, auth_data: Dict[str, Any]) -> bool:
+        """Check a password against a stored auth document"""
+        salt = auth_data.get('salt')
+        if salt:
+            candidate = self.derive_password_hash(password, bytes.fromhex(salt))
+        else:
+            candidate = self.hash_password(password)
+        return hmac.compare_digest(auth_data.get('password_hash', ''), candidate)
     
     def register_user(self, email: str, password: str, name: str, 
                      role: str = "customer", phone: str = "", 
                      address: str = "") -> Tuple[bool, str]:
         """Register a new user"""
         try:
+            # Accounts older than the emails/ index stored their email as typed,
+            # so lookups get the typed form; new accounts store it lowercased
+            typed_email = email.strip()
+            email = typed_email.lower()
+            if not utils.validate_email(email):
+                return False, "Invalid email address"
+            
             # Check if user already exists
-            existing_user = self.db.get_user_by_email(email)
+            existing_user = self.db.get_user_by_email(typed_email)
             if existing_user:
                 return False, "Email already registered"
             
@@ -39,16 +91,9 @@ class AuthManager:
                 address=address
             )
             
-            # Store user in database
-            if self.db.create_user(user):
-                # Store password hash separately (in production, use Firebase Auth)
-                self.db.db.collection('auth').document(uid).set({
-                    'email': email,
-                    'password_hash': self.hash_password(password)
-                })
-                return True, "Registration successful"
-            else:
-                return False, "Failed to create user"
+            # Store user, password hash (in production, use Firebase Auth)
+            # and email lookup entry together
+            return self.db.create_user_with_auth(user, self.make_auth_record(email, password))
             
         except Exception as e:
             return False, f"Registration error: {str(e)}"
@@ -56,22 +101,33 @@ class AuthManager:
     def login(self, email: str, password: str) -> Tuple[bool, str, Optional[User]]:
         """Login user with email and password"""
         try:
-            # Get user by email
-            user = self.db.get_user_by_email(email)
-            if not user:
+            typed_email = email.strip()
+            email = typed_email.lower()
+            if not utils.validate_email(email):
                 return False, "Invalid email or password", None
             
-            # Verify password
-            auth_doc = self.db.db.collection('auth').document(user.uid).get()
-            if not auth_doc.exists:
-                return False, "Authentication data not found", None
+            # Resolve email to user ID
+            uid = self.db.get_user_id_by_email(typed_email)
+            if not uid:
+                return False, "Invalid email or password", None
             
-            auth_data = auth_doc.to_dict()
-            password_hash = self.hash_password(password)
+            # Fetch profile and auth record together
+            user, auth_data = self.db.get_user_with_auth(uid)
+            if not user:
+                return False, "Invalid email or password", None
+            if not auth_data:
+                return False, "Authentication data not found", None
             
-            if auth_data.get('password_hash') != password_hash:
+            # Verify password
+            if not self.verify_password(password, auth_data):
                 return False, "Invalid email or password", None
             
+            # Upgrade legacy SHA-256 records to scrypt on successful login
+            if not auth_data.get('salt'):
+                self.db.db.collection('auth').document(uid).set(
+                    self.make_auth_record(auth_data.get('email', email), password)
+                )
+            
             # Set current user
             self.current_user = user
             return True, "Login successful", user
@@ -2,26 +2,88 @@
 Configuration file for Car Rental System
 Handles Firebase initialization and app settings
 """
-import firebase_admin
-from firebase_admin import credentials, firestore, auth
 import os
+import sys
+import logging
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+# App Configuration
+APP_NAME = "Car Rental System"
+APP_VERSION = "1.0.0"
+
+# UI Configuration
+WINDOW_WIDTH = 1200
+WINDOW_HEIGHT = 700
+
+# Theme Colors
+Theme = namedtuple('Theme', ['primary', 'secondary', 'success', 'danger', 'warning', 'bg'])
+THEME = Theme(
+    primary="#1f538d",
+    secondary="#14375e",
+    success="#2ecc71",
+    danger="#e74c3c",
+    warning="#f39c12",
+    bg="#f0f0f0"
+)
+
+# Colour emoji font for icon-only labels; Roboto has no emoji glyphs, so
+# Tk would otherwise search every installed font for a fallback
+if sys.platform.startswith('win'):
+    EMOJI_FONT_FAMILY = "Segoe UI Emoji"
+elif sys.platform == 'darwin':
+    EMOJI_FONT_FAMILY = "Apple Color Emoji"
+else:
+    EMOJI_FONT_FAMILY = "Noto Color Emoji"
+
+# Fonts shared by the UI modules, as (family, size[, weight]) tuples.
+# dialog_icon, icon, icon_large, avatar and brand_icon are for emoji-only labels.
+Fonts = namedtuple('Fonts', [
+    'header', 'title', 'subtitle', 'section', 'label_bold', 'body', 'body_bold',
+    'button', 'text', 'text_bold', 'small', 'tiny', 'stat', 'dialog_icon', 'icon', 'icon_large',
+    'avatar', 'brand_icon', 'brand_title', 'brand_subtitle', 'form_title', 'lead', 'link'
+])
+FONTS = Fonts(
+    header=("Roboto", 28, "bold"),
+    title=("Roboto", 24, "bold"),
+    subtitle=("Roboto", 20, "bold"),
+    section=("Roboto", 18, "bold"),
+    label_bold=("Roboto", 16, "bold"),
+    body=("Roboto", 14),
+    body_bold=("Roboto", 14, "bold"),
+    button=("Roboto", 13, "bold"),
+    text=("Roboto", 12),
+    text_bold=("Roboto", 12, "bold"),
+    small=("Roboto", 11),
+    tiny=("Roboto", 10),
+    stat=("Roboto", 32, "bold"),
+    dialog_icon=(EMOJI_FONT_FAMILY, 32),
+    icon=(EMOJI_FONT_FAMILY, 40),
+    icon_large=(EMOJI_FONT_FAMILY, 50),
+    avatar=(EMOJI_FONT_FAMILY, 80),
+    brand_icon=(EMOJI_FONT_FAMILY, 100),
+    brand_title=("Roboto", 42, "bold"),
+    brand_subtitle=("Roboto", 18),
+    form_title=("Roboto", 32, "bold"),
+    lead=("Roboto", 16),
+    link=("Roboto", 13)
+)
 
 class Config:
-    # App Configuration
-    APP_NAME = "Car Rental System"
-    APP_VERSION = "1.0.0"
+    # Class attributes mirror the module-level constants for existing callers
+    APP_NAME = APP_NAME
+    APP_VERSION = APP_VERSION
     
-    # UI Configuration
-    WINDOW_WIDTH = 1200
-    WINDOW_HEIGHT = 700
+    WINDOW_WIDTH = WINDOW_WIDTH
+    WINDOW_HEIGHT = WINDOW_HEIGHT
     
-    # Theme Colors
-    PRIMARY_COLOR = "#1f538d"
-    SECONDARY_COLOR = "#14375e"
-    SUCCESS_COLOR = "#2ecc71"
-    DANGER_COLOR = "#e74c3c"
-    WARNING_COLOR = "#f39c12"
-    BG_COLOR = "#f0f0f0"
+    PRIMARY_COLOR = THEME.primary
+    SECONDARY_COLOR = THEME.secondary
+    SUCCESS_COLOR = THEME.success
+    DANGER_COLOR = THEME.danger
+    WARNING_COLOR = THEME.warning
+    BG_COLOR = THEME.bg
     
     # Firebase
     _firebase_initialized = False
@@ -31,6 +93,10 @@ class Config:
     def initialize_firebase(cls, credential_path="serviceAccountKey.json"):
         """Initialize Firebase Admin SDK"""
         if not cls._firebase_initialized:
+            # Deferred so importing config does not load gRPC/protobuf
+            import firebase_admin
+            from firebase_admin import credentials, firestore
+            
             try:
                 if not os.path.exists(credential_path):
                     raise FileNotFoundError(
@@ -42,9 +108,9 @@ class Config:
                 firebase_admin.initialize_app(cred)
                 cls._db = firestore.client()
                 cls._firebase_initialized = True
-                print("✓ Firebase initialized successfully")
+                logger.info("✓ Firebase initialized successfully")
             except Exception as e:
-                print(f"✗ Firebase initialization error: {e}")
+                logger.error("✗ Firebase initialization error: %s", e)
                 raise
     
     @classmethod
@@ -53,9 +119,3 @@ class Config:
         if not cls._firebase_initialized:
             cls.initialize_firebase()
         return cls._db
-
-# Initialize Firebase on module import
-try:
-    Config.initialize_firebase()
-except Exception as e:
-    print(f"Warning: {e}")
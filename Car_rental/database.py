@@ -2,23 +2,116 @@
 Database operations for Firebase Firestore
 """
 from config import Config
+from firebase_admin import firestore
+from google.api_core.exceptions import Conflict
 from models import User, Car, Booking, Payment
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-import uuid
+from datetime import date, datetime
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from ulid import ULID
+
+logger = logging.getLogger(__name__)
+
+_BOOKING_RANGE_FIELDS = itemgetter('booking_id', 'start_date', 'end_date')
+
+# Most values Firestore accepts in one 'in' filter
+_IN_QUERY_LIMIT = 30
+
+# Most writes Firestore accepts in one batch
+_BATCH_WRITE_LIMIT = 500
+
+
+def _find_conflict(booking_docs, start_date: datetime, end_date: datetime,
+                   exclude_booking_id: str = None) -> bool:
+    """Return True if any of the given booking snapshots overlaps the date range"""
+    get_fields = _BOOKING_RANGE_FIELDS
+    for booking_doc in booking_docs:
+        booking_id, existing_start, existing_end = get_fields(booking_doc.to_dict())
+        
+        # Skip if this is the booking being updated
+        if exclude_booking_id and booking_id == exclude_booking_id:
+            continue
+        
+        # Check for date overlap
+        if not (end_date <= existing_start or start_date >= existing_end):
+            return True
+    
+    return False
+
+
+def _overlap_candidates_query(db, car_id: str, end_date: datetime):
+    """Active bookings for a car that start before end_date.
+    
+    Backed by the (car_id, status, start_date) composite index in
+    firestore.indexes.json; callers still filter on end_date client-side
+    since Firestore allows a range filter on only one field. Only the
+    fields _find_conflict reads are fetched.
+    """
+    return db.collection('bookings')\
+        .where('car_id', '==', car_id)\
+        .where('status', '==', 'Active')\
+        .where('start_date', '<', end_date)\
+        .select(['booking_id', 'start_date', 'end_date'])
+
+
+@firestore.transactional
+def _create_booking_txn(transaction, db, booking: Booking, payment: Optional[Payment] = None) -> bool:
+    """Check availability and write booking + car status (+ payment) in one transaction"""
+    candidates = _overlap_candidates_query(db, booking.car_id, booking.end_date)
+    
+    if _find_conflict(transaction.get(candidates), booking.start_date, booking.end_date):
+        return False
+    
+    transaction.set(db.collection('bookings').document(booking.booking_id), booking.to_dict())
+    transaction.update(db.collection('cars').document(booking.car_id), {'status': 'Booked'})
+    if payment is not None:
+        transaction.set(db.collection('payments').document(payment.payment_id), payment.to_dict())
+    return True
+
+
+@firestore.transactional
+def _close_booking_txn(transaction, db, booking_id: str, status: str) -> bool:
+    """Set a booking's final status and release its car in one transaction"""
+    booking_ref = db.collection('bookings').document(booking_id)
+    snapshot = booking_ref.get(transaction=transaction)
+    if not snapshot.exists:
+        return False
+    
+    transaction.update(booking_ref, {'status': status})
+    transaction.update(db.collection('cars').document(snapshot.get('car_id')), {'status': 'Available'})
+    return True
+
 
 class Database:
+    # Seconds a computed dashboard stats snapshot stays valid
+    STATS_CACHE_TTL = 30
+    
+    _instance: Optional['Database'] = None
+    
     def __init__(self):
         self.db = Config.get_db()
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_time = 0.0
+    
+    @classmethod
+    def get(cls) -> 'Database':
+        """Get the shared Database instance (reuses one Firestore client)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
     
     # User Operations
     def create_user(self, user: User) -> bool:
         """Create a new user in Firestore"""
         try:
             self.db.collection('users').document(user.uid).set(user.to_dict())
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
             return False
     
     def get_user(self, uid: str) -> Optional[User]:
@@ -26,48 +119,173 @@ class Database:
         try:
             doc = self.db.collection('users').document(uid).get()
             if doc.exists:
-                return User.from_dict(doc.to_dict())
+                return User.from_trusted_dict(doc.to_dict())
             return None
         except Exception as e:
-            print(f"Error getting user: {e}")
+            logger.error("Error getting user: %s", e)
             return None
     
+    def create_user_with_auth(self, user: User, auth_record: Dict[str, Any]) -> Tuple[bool, str]:
+        """Create a user, its auth record and its email lookup entry in one batch.
+        
+        The lookup entry is written with create(), so the whole batch fails if
+        the email is already taken, even by a registration racing this one.
+        Returns (success, message).
+        """
+        try:
+            batch = self.db.batch()
+            batch.set(self.db.collection('users').document(user.uid), user.to_dict())
+            batch.set(self.db.collection('auth').document(user.uid), auth_record)
+            batch.create(self.db.collection('emails').document(user.email.lower()), {'uid': user.uid})
+            batch.commit()
+            self.invalidate_stats_cache()
+            return True, "Registration successful"
+        except Conflict:
+            # AlreadyExists is a Conflict: the emails/ entry is already there
+            return False, "Email already registered"
+        except Exception as e:
+            logger.error("Error creating user: %s", e)
+            return False, "Failed to create user"
+    
+    def _find_user_doc_by_email(self, email: str):
+        """Query users by email for accounts missing from the email index.
+        
+        backfill_email_index normally gives every account an entry; this
+        read-only fallback covers a startup where it could not run. Such
+        accounts stored the email as typed, so only the given form and its
+        lowercase can match here.
+        """
+        candidates = list({email, email.lower()})
+        users = self.db.collection('users').where('email', 'in', candidates).limit(1).get()
+        return users[0] if users else None
+    
+    def backfill_email_index(self) -> int:
+        """Add emails/{email} lookup entries for accounts that predate the index.
+        
+        A one-off migration: a flag in meta/migrations records that it
+        finished, so later startups skip the users scan. Entries are keyed by
+        the lowercased email, which makes every lookup case-insensitive.
+        Returns the number of entries added.
+        """
+        try:
+            marker = self.db.collection('meta').document('migrations')
+            if (marker.get().to_dict() or {}).get('email_index'):
+                return 0
+            
+            # Oldest account first (IDs are ULIDs), so it keeps a shared email
+            owners = {}
+            for user_doc in self.db.collection('users').select(['email']).get():
+                email = (user_doc.to_dict() or {}).get('email', '').strip().lower()
+                if not email or '/' in email:
+                    logger.warning("Not indexing account %s with email %r", user_doc.id, email)
+                    continue
+                if email in owners:
+                    logger.warning("Accounts %s and %s share email %s; indexing the first",
+                                   owners[email], user_doc.id, email)
+                    continue
+                owners[email] = user_doc.id
+            
+            index = self.db.collection('emails')
+            indexed = {doc.id for doc in self.db.get_all([index.document(e) for e in owners])
+                       if doc.exists}
+            missing = [(email, uid) for email, uid in owners.items() if email not in indexed]
+            
+            for start in range(0, len(missing), _BATCH_WRITE_LIMIT):
+                batch = self.db.batch()
+                for email, uid in missing[start:start + _BATCH_WRITE_LIMIT]:
+                    batch.create(index.document(email), {'uid': uid})
+                batch.commit()
+            
+            marker.set({'email_index': True}, merge=True)
+            return len(missing)
+        except Exception as e:
+            logger.error("Error backfilling email index: %s", e)
+            return 0
+    
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
         try:
-            users = self.db.collection('users').where('email', '==', email).limit(1).get()
-            if users:
-                return User.from_dict(users[0].to_dict())
+            doc = self.db.collection('emails').document(email.lower()).get()
+            if doc.exists:
+                return self.get_user(doc.get('uid'))
+            
+            user_doc = self._find_user_doc_by_email(email)
+            if user_doc:
+                return User.from_trusted_dict(user_doc.to_dict())
+            return None
+        except Exception as e:
+            logger.error("Error getting user by email: %s", e)
+            return None
+    
+    def get_user_id_by_email(self, email: str) -> Optional[str]:
+        """Resolve an email to a user ID via the emails/{email} lookup doc"""
+        try:
+            doc = self.db.collection('emails').document(email.lower()).get()
+            if doc.exists:
+                return doc.get('uid')
+            
+            user_doc = self._find_user_doc_by_email(email)
+            if user_doc:
+                return user_doc.id
             return None
         except Exception as e:
-            print(f"Error getting user by email: {e}")
+            logger.error("Error resolving user by email: %s", e)
             return None
     
+    def get_user_with_auth(self, uid: str) -> Tuple[Optional[User], Optional[Dict[str, Any]]]:
+        """Get a user and its auth record in a single batched read"""
+        try:
+            refs = [self.db.collection('users').document(uid),
+                    self.db.collection('auth').document(uid)]
+            user, auth_data = None, None
+            for doc in self.db.get_all(refs):
+                if not doc.exists:
+                    continue
+                if doc.reference.parent.id == 'users':
+                    user = User.from_trusted_dict(doc.to_dict())
+                else:
+                    auth_data = doc.to_dict()
+            return user, auth_data
+        except Exception as e:
+            logger.error("Error getting user with auth: %s", e)
+            return None, None
+    
     def update_user(self, uid: str, data: Dict[str, Any]) -> bool:
         """Update user information"""
         try:
             self.db.collection('users').document(uid).update(data)
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error updating user: {e}")
+            logger.error("Error updating user: %s", e)
             return False
     
+    def iter_all_customers(self) -> Iterator[User]:
+        """Stream all customers one document at a time"""
+        for user in self.db.collection('users').where('role', '==', 'customer').stream():
+            yield User.from_trusted_dict(user.to_dict())
+    
     def get_all_customers(self) -> List[User]:
         """Get all customers"""
         try:
-            users = self.db.collection('users').where('role', '==', 'customer').get()
-            return [User.from_dict(user.to_dict()) for user in users]
+            return list(self.iter_all_customers())
         except Exception as e:
-            print(f"Error getting customers: {e}")
+            logger.error("Error getting customers: %s", e)
             return []
     
     def delete_user(self, uid: str) -> bool:
         """Delete a user"""
         try:
-            self.db.collection('users').document(uid).delete()
+            user = self.get_user(uid)
+            batch = self.db.batch()
+            batch.delete(self.db.collection('users').document(uid))
+            if user:
+                batch.delete(self.db.collection('emails').document(user.email.lower()))
+            batch.commit()
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error deleting user: {e}")
+            logger.error("Error deleting user: %s", e)
             return False
     
     # Car Operations
@@ -75,9 +293,23 @@ class Database:
         """Add a new car"""
         try:
             self.db.collection('cars').document(car.car_id).set(car.to_dict())
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error adding car: {e}")
+            logger.error("Error adding car: %s", e)
+            return False
+    
+    def bulk_add_cars(self, cars: List[Car]) -> bool:
+        """Add several cars in a single batched write"""
+        try:
+            batch = self.db.batch()
+            for car in cars:
+                batch.set(self.db.collection('cars').document(car.car_id), car.to_dict())
+            batch.commit()
+            self.invalidate_stats_cache()
+            return True
+        except Exception as e:
+            logger.error("Error adding cars: %s", e)
             return False
     
     def get_car(self, car_id: str) -> Optional[Car]:
@@ -85,46 +317,60 @@ class Database:
         try:
             doc = self.db.collection('cars').document(car_id).get()
             if doc.exists:
-                return Car.from_dict(doc.to_dict())
+                return Car.from_trusted_dict(doc.to_dict())
             return None
         except Exception as e:
-            print(f"Error getting car: {e}")
+            logger.error("Error getting car: %s", e)
             return None
     
+    def iter_all_cars(self) -> Iterator[Car]:
+        """Stream all cars one document at a time"""
+        for car in self.db.collection('cars').stream():
+            yield Car.from_trusted_dict(car.to_dict())
+    
     def get_all_cars(self) -> List[Car]:
         """Get all cars"""
         try:
-            cars = self.db.collection('cars').get()
-            return [Car.from_dict(car.to_dict()) for car in cars]
+            return list(self.iter_all_cars())
         except Exception as e:
-            print(f"Error getting cars: {e}")
+            logger.error("Error getting cars: %s", e)
             return []
     
+    def has_cars(self) -> bool:
+        """Check whether at least one car exists (reads at most one document)"""
+        try:
+            return next(self.db.collection('cars').limit(1).stream(), None) is not None
+        except Exception as e:
+            logger.error("Error checking cars: %s", e)
+            return False
+    
     def get_available_cars(self) -> List[Car]:
         """Get all available cars"""
         try:
             cars = self.db.collection('cars').where('status', '==', 'Available').get()
-            return [Car.from_dict(car.to_dict()) for car in cars]
+            return Car.from_dict_many(car.to_dict() for car in cars)
         except Exception as e:
-            print(f"Error getting available cars: {e}")
+            logger.error("Error getting available cars: %s", e)
             return []
     
     def update_car(self, car_id: str, data: Dict[str, Any]) -> bool:
         """Update car information"""
         try:
             self.db.collection('cars').document(car_id).update(data)
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error updating car: {e}")
+            logger.error("Error updating car: %s", e)
             return False
     
     def delete_car(self, car_id: str) -> bool:
         """Delete a car"""
         try:
             self.db.collection('cars').document(car_id).delete()
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error deleting car: {e}")
+            logger.error("Error deleting car: %s", e)
             return False
     
     def update_car_status(self, car_id: str, status: str) -> bool:
@@ -135,112 +381,152 @@ class Database:
     def create_booking(self, booking: Booking) -> bool:
         """Create a new booking"""
         try:
-            # Check for booking conflicts
-            if not self.check_car_availability(booking.car_id, booking.start_date, booking.end_date):
-                print("Car is not available for the selected dates")
+            # Conflict check and both writes commit atomically
+            if not _create_booking_txn(self.db.transaction(), self.db, booking):
+                logger.info("Car is not available for the selected dates")
                 return False
             
-            self.db.collection('bookings').document(booking.booking_id).set(booking.to_dict())
-            # Update car status to Booked
-            self.update_car_status(booking.car_id, 'Booked')
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error creating booking: {e}")
+            logger.error("Error creating booking: %s", e)
             return False
     
+    def create_booking_with_payment(self, booking: Booking, payment: Payment) -> Tuple[bool, str]:
+        """Create a booking and its payment record in one transaction.
+        
+        The transaction's own overlap check decides availability, so callers
+        need no separate check. Returns (success, message); a date conflict
+        and a failed write get different messages.
+        """
+        try:
+            if not _create_booking_txn(self.db.transaction(), self.db, booking, payment):
+                logger.info("Car is not available for the selected dates")
+                return False, "Car is not available for selected dates"
+            
+            self.invalidate_stats_cache()
+            return True, "Booking confirmed successfully!"
+        except Exception as e:
+            logger.error("Error creating booking with payment: %s", e)
+            return False, "Failed to create booking. Please try again."
+    
     def get_booking(self, booking_id: str) -> Optional[Booking]:
         """Get booking by ID"""
         try:
             doc = self.db.collection('bookings').document(booking_id).get()
             if doc.exists:
-                return Booking.from_dict(doc.to_dict())
+                return Booking.from_trusted_dict(doc.to_dict())
             return None
         except Exception as e:
-            print(f"Error getting booking: {e}")
+            logger.error("Error getting booking: %s", e)
             return None
     
+    def iter_all_bookings(self) -> Iterator[Booking]:
+        """Stream all bookings one document at a time"""
+        for booking in self.db.collection('bookings').stream():
+            yield Booking.from_trusted_dict(booking.to_dict())
+    
     def get_all_bookings(self) -> List[Booking]:
         """Get all bookings"""
         try:
-            bookings = self.db.collection('bookings').get()
-            return [Booking.from_dict(booking.to_dict()) for booking in bookings]
+            return list(self.iter_all_bookings())
+        except Exception as e:
+            logger.error("Error getting bookings: %s", e)
+            return []
+    
+    def get_recent_bookings(self, limit: int = 10) -> List[Booking]:
+        """Get the most recently created bookings, newest first"""
+        try:
+            bookings = self.db.collection('bookings')\
+                .order_by('created_at', direction=firestore.Query.DESCENDING)\
+                .limit(limit)\
+                .get()
+            return Booking.from_dict_many(booking.to_dict() for booking in bookings)
         except Exception as e:
-            print(f"Error getting bookings: {e}")
+            logger.error("Error getting recent bookings: %s", e)
             return []
     
-    def get_customer_bookings(self, customer_id: str) -> List[Booking]:
-        """Get all bookings for a customer"""
+    def get_customer_bookings(self, customer_id: str, limit: Optional[int] = None) -> List[Booking]:
+        """Get all bookings for a customer, or only the limit most recently created"""
         try:
-            bookings = self.db.collection('bookings').where('customer_id', '==', customer_id).get()
-            return [Booking.from_dict(booking.to_dict()) for booking in bookings]
+            query = self.db.collection('bookings').where('customer_id', '==', customer_id)
+            if limit is not None:
+                # Needs the (customer_id, created_at DESC) composite index
+                query = query.order_by('created_at', direction=firestore.Query.DESCENDING)\
+                    .limit(limit)
+            bookings = query.get()
+            return Booking.from_dict_many(booking.to_dict() for booking in bookings)
         except Exception as e:
-            print(f"Error getting customer bookings: {e}")
+            logger.error("Error getting customer bookings: %s", e)
             return []
     
+    def get_customer_booking_stats(self, customer_id: str) -> Dict[str, int]:
+        """Count a customer's active, completed and total bookings with aggregation queries"""
+        try:
+            bookings = self.db.collection('bookings').where('customer_id', '==', customer_id)
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                pending = {
+                    'active': pool.submit(
+                        self._aggregate_count, bookings.where('status', '==', 'Active')),
+                    'completed': pool.submit(
+                        self._aggregate_count, bookings.where('status', '==', 'Completed')),
+                    'total': pool.submit(self._aggregate_count, bookings),
+                }
+            return {name: future.result() for name, future in pending.items()}
+        except Exception as e:
+            logger.error("Error getting customer booking stats: %s", e)
+            return {'active': 0, 'completed': 0, 'total': 0}
+    
     def update_booking(self, booking_id: str, data: Dict[str, Any]) -> bool:
         """Update booking information"""
         try:
             self.db.collection('bookings').document(booking_id).update(data)
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error updating booking: {e}")
+            logger.error("Error updating booking: %s", e)
             return False
     
     def cancel_booking(self, booking_id: str) -> bool:
         """Cancel a booking"""
         try:
-            booking = self.get_booking(booking_id)
-            if booking:
-                self.update_booking(booking_id, {'status': 'Cancelled'})
-                # Update car status back to Available
-                self.update_car_status(booking.car_id, 'Available')
+            # Booking status and car status flip together
+            if _close_booking_txn(self.db.transaction(), self.db, booking_id, 'Cancelled'):
+                self.invalidate_stats_cache()
                 return True
             return False
         except Exception as e:
-            print(f"Error cancelling booking: {e}")
+            logger.error("Error cancelling booking: %s", e)
             return False
     
     def complete_booking(self, booking_id: str) -> bool:
         """Complete a booking"""
         try:
-            booking = self.get_booking(booking_id)
-            if booking:
-                self.update_booking(booking_id, {'status': 'Completed'})
-                # Update car status back to Available
-                self.update_car_status(booking.car_id, 'Available')
+            # Booking status and car status flip together
+            if _close_booking_txn(self.db.transaction(), self.db, booking_id, 'Completed'):
+                self.invalidate_stats_cache()
                 return True
             return False
         except Exception as e:
-            print(f"Error completing booking: {e}")
+            logger.error("Error completing booking: %s", e)
             return False
     
     def check_car_availability(self, car_id: str, start_date: datetime, 
                                end_date: datetime, exclude_booking_id: str = None) -> bool:
         """Check if a car is available for the given date range"""
         try:
-            # Get all active bookings for this car
-            bookings = self.db.collection('bookings')\
-                .where('car_id', '==', car_id)\
-                .where('status', '==', 'Active')\
-                .get()
+            # Firestore only stores full timestamps, not bare dates
+            if type(start_date) is date:
+                start_date = datetime(start_date.year, start_date.month, start_date.day)
+            if type(end_date) is date:
+                end_date = datetime(end_date.year, end_date.month, end_date.day)
             
-            for booking_doc in bookings:
-                booking_data = booking_doc.to_dict()
-                
-                # Skip if this is the booking being updated
-                if exclude_booking_id and booking_data['booking_id'] == exclude_booking_id:
-                    continue
-                
-                existing_start = booking_data['start_date']
-                existing_end = booking_data['end_date']
-                
-                # Check for date overlap
-                if not (end_date <= existing_start or start_date >= existing_end):
-                    return False
+            # Only active bookings starting before end_date can overlap
+            bookings = _overlap_candidates_query(self.db, car_id, end_date).stream()
             
-            return True
+            return not _find_conflict(bookings, start_date, end_date, exclude_booking_id)
         except Exception as e:
-            print(f"Error checking car availability: {e}")
+            logger.error("Error checking car availability: %s", e)
             return False
     
     # Payment Operations
@@ -248,9 +534,10 @@ class Database:
         """Create a new payment record"""
         try:
             self.db.collection('payments').document(payment.payment_id).set(payment.to_dict())
+            self.invalidate_stats_cache()
             return True
         except Exception as e:
-            print(f"Error creating payment: {e}")
+            logger.error("Error creating payment: %s", e)
             return False
     
     def get_payment(self, payment_id: str) -> Optional[Payment]:
@@ -258,57 +545,108 @@ class Database:
         try:
             doc = self.db.collection('payments').document(payment_id).get()
             if doc.exists:
-                return Payment.from_dict(doc.to_dict())
+                return Payment.from_trusted_dict(doc.to_dict())
             return None
         except Exception as e:
-            print(f"Error getting payment: {e}")
+            logger.error("Error getting payment: %s", e)
             return None
     
+    def iter_all_payments(self) -> Iterator[Payment]:
+        """Stream all payments one document at a time"""
+        for payment in self.db.collection('payments').stream():
+            yield Payment.from_trusted_dict(payment.to_dict())
+    
     def get_all_payments(self) -> List[Payment]:
         """Get all payments"""
         try:
-            payments = self.db.collection('payments').get()
-            return [Payment.from_dict(payment.to_dict()) for payment in payments]
+            return list(self.iter_all_payments())
         except Exception as e:
-            print(f"Error getting payments: {e}")
+            logger.error("Error getting payments: %s", e)
             return []
     
     def get_booking_payments(self, booking_id: str) -> List[Payment]:
         """Get all payments for a booking"""
         try:
             payments = self.db.collection('payments').where('booking_id', '==', booking_id).get()
-            return [Payment.from_dict(payment.to_dict()) for payment in payments]
+            return Payment.from_dict_many(payment.to_dict() for payment in payments)
         except Exception as e:
-            print(f"Error getting booking payments: {e}")
+            logger.error("Error getting booking payments: %s", e)
+            return []
+    
+    def get_customer_payments(self, customer_id: str) -> List[Payment]:
+        """Get all payments for a customer's bookings, newest first.
+        
+        Firestore has no joins, so the customer's booking ids are read first
+        (ids only) and their payments fetched with 'in' filters.
+        """
+        try:
+            booking_refs = self.db.collection('bookings')\
+                .where('customer_id', '==', customer_id).select([]).stream()
+            booking_ids = [doc.id for doc in booking_refs]
+            
+            payments = self.db.collection('payments')
+            customer_payments = []
+            for i in range(0, len(booking_ids), _IN_QUERY_LIMIT):
+                docs = payments.where('booking_id', 'in', booking_ids[i:i + _IN_QUERY_LIMIT]).get()
+                customer_payments.extend(Payment.from_dict_many(doc.to_dict() for doc in docs))
+            
+            customer_payments.sort(key=lambda p: p.payment_date, reverse=True)
+            return customer_payments
+        except Exception as e:
+            logger.error("Error getting customer payments: %s", e)
             return []
     
     # Utility Methods
     def generate_id(self, prefix: str = "") -> str:
-        """Generate a unique ID"""
-        return f"{prefix}{uuid.uuid4().hex[:8].upper()}"
+        """Generate a unique, time-ordered ID (ULID)"""
+        return f"{prefix}{ULID()}"
+    
+    def invalidate_stats_cache(self):
+        """Drop the cached dashboard statistics"""
+        self._stats_cache = None
+    
+    def _aggregate_count(self, query) -> int:
+        """Run a server-side count() aggregation on a query"""
+        result = query.count(alias='count').get()
+        return int(result[0][0].value) if result else 0
+    
+    def _aggregate_sum(self, query, field: str) -> float:
+        """Run a server-side sum() aggregation on a query"""
+        result = query.sum(field, alias='total').get()
+        return float(result[0][0].value or 0) if result else 0.0
     
     def get_dashboard_stats(self) -> Dict[str, Any]:
-        """Get statistics for dashboard"""
+        """Get statistics for dashboard using aggregation queries (cached briefly)"""
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache_time < self.STATS_CACHE_TTL:
+            return dict(self._stats_cache)
+        
         try:
-            total_cars = len(self.get_all_cars())
-            available_cars = len(self.get_available_cars())
-            total_bookings = len(self.get_all_bookings())
-            active_bookings = len([b for b in self.get_all_bookings() if b.status == 'Active'])
-            total_customers = len(self.get_all_customers())
+            cars = self.db.collection('cars')
+            bookings = self.db.collection('bookings')
             
-            # Calculate total revenue
-            payments = self.get_all_payments()
-            total_revenue = sum(p.amount for p in payments)
+            # Firestore cannot combine aggregations over different collections
+            # or filters into one request, so issue them all at once instead
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                pending = {
+                    'total_cars': pool.submit(self._aggregate_count, cars),
+                    'available_cars': pool.submit(
+                        self._aggregate_count, cars.where('status', '==', 'Available')),
+                    'total_bookings': pool.submit(self._aggregate_count, bookings),
+                    'active_bookings': pool.submit(
+                        self._aggregate_count, bookings.where('status', '==', 'Active')),
+                    'total_customers': pool.submit(
+                        self._aggregate_count,
+                        self.db.collection('users').where('role', '==', 'customer')),
+                    'total_revenue': pool.submit(
+                        self._aggregate_sum, self.db.collection('payments'), 'amount'),
+                }
             
-            return {
-                'total_cars': total_cars,
-                'available_cars': available_cars,
-                'booked_cars': total_cars - available_cars,
-                'total_bookings': total_bookings,
-                'active_bookings': active_bookings,
-                'total_customers': total_customers,
-                'total_revenue': total_revenue
-            }
-        except Exception as e:
-            print(f"Error getting dashboard stats: {e}")
+            stats = {name: future.result() for name, future in pending.items()}
+            stats['booked_cars'] = stats['total_cars'] - stats['available_cars']
+            self._stats_cache = stats
+            self._stats_cache_time = now
+            return dict(stats)
+        except Exception as e:
+            logger.error("Error getting dashboard stats: %s", e)
             return {}
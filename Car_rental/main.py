@@ -3,9 +3,48 @@ Main entry point for Car Rental System
 Optimized with proper exception handling, error recovery, and logout management
 """
 import sys
+import logging
+import logging.handlers
 import traceback
-import customtkinter as ctk
-from datetime import datetime
+from importlib.util import find_spec
+
+logger = logging.getLogger(__name__)
+
+# Startup messages are collected here and written out in batches
+_log_buffer = None
+_console = None
+
+
+def setup_logging():
+    """Send application logs to stdout, buffered until end_startup_logging()"""
+    global _log_buffer, _console
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    _console = console
+    
+    # During startup errors flush immediately; everything else is written
+    # 64 records at a time
+    _log_buffer = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=console
+    )
+    
+    root = logging.getLogger()
+    root.addHandler(_log_buffer)
+    root.setLevel(logging.INFO)
+
+
+def end_startup_logging():
+    """Flush the startup burst and log straight to stdout from here on"""
+    global _log_buffer
+    if _log_buffer is None:
+        return
+    
+    root = logging.getLogger()
+    _log_buffer.flush()
+    root.removeHandler(_log_buffer)
+    _log_buffer.close()
+    _log_buffer = None
+    root.addHandler(_console)
 
 
 def setup_initial_data():
@@ -14,14 +53,19 @@ def setup_initial_data():
     from models import Car
     from auth import AuthManager
     
-    db = Database()
-    auth = AuthManager()
+    db = Database.get()
+    auth = AuthManager.get()
+    
+    # One-off: give accounts older than the email index their lookup entry
+    added = db.backfill_email_index()
+    if added:
+        logger.info("✓ Indexed %d existing account emails", added)
     
     try:
         # Check if admin exists
         admin = db.get_user_by_email("admin@carrental.com")
         if not admin:
-            print("Creating default admin account...")
+            logger.info("Creating default admin account...")
             success, message = auth.register_user(
                 email="admin@carrental.com",
                 password="admin123",
@@ -31,21 +75,20 @@ def setup_initial_data():
                 address="Head Office, Mumbai"
             )
             if success:
-                print("✓ Admin account created")
-                print("  Email: admin@carrental.com")
-                print("  Password: admin123")
+                logger.info("✓ Admin account created")
+                logger.info("  Email: admin@carrental.com")
+                logger.info("  Password: admin123")
             else:
-                print(f"✗ Failed to create admin: {message}")
+                logger.error("✗ Failed to create admin: %s", message)
                 return False
     except Exception as e:
-        print(f"✗ Error checking/creating admin: {e}")
+        logger.error("✗ Error checking/creating admin: %s", e)
         return False
     
     try:
         # Add sample cars if none exist
-        cars = db.get_all_cars()
-        if len(cars) == 0:
-            print("Adding sample cars...")
+        if not db.has_cars():
+            logger.info("Adding sample cars...")
             sample_cars = [
                 Car(
                     car_id=db.generate_id("CAR_"),
@@ -115,24 +158,16 @@ def setup_initial_data():
                 ),
             ]
             
-            success_count = 0
-            for car in sample_cars:
-                try:
-                    if db.add_car(car):
-                        print(f"  ✓ Added {car.brand} {car.model}")
-                        success_count += 1
-                    else:
-                        print(f"  ✗ Failed to add {car.brand} {car.model}")
-                except Exception as e:
-                    print(f"  ✗ Error adding {car.brand} {car.model}: {e}")
-            
-            if success_count > 0:
-                print(f"Successfully added {success_count}/{len(sample_cars)} cars")
+            # Insert all sample cars with one batched write
+            if db.bulk_add_cars(sample_cars):
+                for car in sample_cars:
+                    logger.info("  ✓ Added %s %s", car.brand, car.model)
+                logger.info("Successfully added %d/%d cars", len(sample_cars), len(sample_cars))
             else:
-                print("Warning: No sample cars were added")
+                logger.warning("Warning: No sample cars were added")
                 
     except Exception as e:
-        print(f"✗ Error setting up sample cars: {e}")
+        logger.error("✗ Error setting up sample cars: %s", e)
         return False
     
     return True
@@ -146,35 +181,35 @@ def initialize_firebase():
         Config.initialize_firebase()
         return True
     except FileNotFoundError:
-        print()
-        print("=" * 60)
-        print("ERROR: Firebase credentials not found!")
-        print("=" * 60)
-        print()
-        print("Please follow these steps:")
-        print("1. Go to Firebase Console (https://console.firebase.google.com)")
-        print("2. Select your project or create a new one")
-        print("3. Go to Project Settings > Service Accounts")
-        print("4. Click 'Generate New Private Key'")
-        print("5. Save the file as 'serviceAccountKey.json' in project root")
-        print()
-        print("Expected location: ./serviceAccountKey.json")
-        print("=" * 60)
+        logger.error("")
+        logger.error("=" * 60)
+        logger.error("ERROR: Firebase credentials not found!")
+        logger.error("=" * 60)
+        logger.error("")
+        logger.error("Please follow these steps:")
+        logger.error("1. Go to Firebase Console (https://console.firebase.google.com)")
+        logger.error("2. Select your project or create a new one")
+        logger.error("3. Go to Project Settings > Service Accounts")
+        logger.error("4. Click 'Generate New Private Key'")
+        logger.error("5. Save the file as 'serviceAccountKey.json' in project root")
+        logger.error("")
+        logger.error("Expected location: ./serviceAccountKey.json")
+        logger.error("=" * 60)
         return False
     except Exception as e:
-        print()
-        print("=" * 60)
-        print("ERROR: Firebase initialization failed!")
-        print("=" * 60)
-        print(f"Error: {str(e)}")
-        print()
-        print("Common solutions:")
-        print("1. Verify serviceAccountKey.json is valid JSON")
-        print("2. Check your internet connection")
-        print("3. Ensure Firebase project has Firestore enabled")
-        print("4. Verify service account has proper permissions")
-        print()
-        print("=" * 60)
+        logger.error("")
+        logger.error("=" * 60)
+        logger.error("ERROR: Firebase initialization failed!")
+        logger.error("=" * 60)
+        logger.error("Error: %s", e)
+        logger.error("")
+        logger.error("Common solutions:")
+        logger.error("1. Verify serviceAccountKey.json is valid JSON")
+        logger.error("2. Check your internet connection")
+        logger.error("3. Ensure Firebase project has Firestore enabled")
+        logger.error("4. Verify service account has proper permissions")
+        logger.error("")
+        logger.error("=" * 60)
         return False
 
 
@@ -188,30 +223,30 @@ def start_application():
         app.protocol("WM_DELETE_WINDOW", lambda: on_closing(app))
         app.mainloop()
     except KeyboardInterrupt:
-        print("\n\nApplication interrupted by user")
+        logger.info("\n\nApplication interrupted by user")
         cleanup_and_exit(0)
     except Exception as e:
-        print()
-        print("=" * 60)
-        print("ERROR: Application crashed!")
-        print("=" * 60)
-        print(f"Error: {str(e)}")
-        print()
-        print("Full traceback:")
-        traceback.print_exc()
-        print("=" * 60)
+        logger.error("")
+        logger.error("=" * 60)
+        logger.error("ERROR: Application crashed!")
+        logger.error("=" * 60)
+        logger.error("Error: %s", e)
+        logger.error("")
+        logger.error("Full traceback:")
+        logger.error(traceback.format_exc().rstrip())
+        logger.error("=" * 60)
         cleanup_and_exit(1)
 
 
 def on_closing(window):
     """Handle window closing event"""
     try:
-        print("\nClosing application...")
+        logger.info("\nClosing application...")
         window.quit()
         window.destroy()
         cleanup_and_exit(0)
     except Exception as e:
-        print(f"Error during shutdown: {e}")
+        logger.error("Error during shutdown: %s", e)
         cleanup_and_exit(1)
 
 
@@ -220,14 +255,14 @@ def cleanup_and_exit(exit_code=0):
     try:
         # Logout current user if any
         from auth import AuthManager
-        auth = AuthManager()
+        auth = AuthManager.get()
         if auth.is_logged_in():
             auth.logout()
-            print("User logged out")
+            logger.info("User logged out")
     except Exception as e:
-        print(f"Cleanup warning: {e}")
+        logger.warning("Cleanup warning: %s", e)
     
-    print("Application terminated")
+    logger.info("Application terminated")
     sys.exit(exit_code)
 
 
@@ -237,34 +272,33 @@ def check_dependencies():
         'customtkinter': 'customtkinter',
         'firebase_admin': 'firebase-admin',
         'PIL': 'Pillow',
-        'tkcalendar': 'tkcalendar'
+        'tkcalendar': 'tkcalendar',
+        'ulid': 'python-ulid'
     }
     
-    missing_modules = []
-    
-    for module_name, package_name in required_modules.items():
-        try:
-            __import__(module_name)
-        except ImportError:
-            missing_modules.append(package_name)
+    # find_spec only locates the modules; nothing is imported or executed here
+    missing_modules = [
+        package_name for module_name, package_name in required_modules.items()
+        if find_spec(module_name) is None
+    ]
     
     if missing_modules:
-        print()
-        print("=" * 60)
-        print("ERROR: Missing required dependencies!")
-        print("=" * 60)
-        print()
-        print("Missing packages:")
+        logger.error("")
+        logger.error("=" * 60)
+        logger.error("ERROR: Missing required dependencies!")
+        logger.error("=" * 60)
+        logger.error("")
+        logger.error("Missing packages:")
         for package in missing_modules:
-            print(f"  - {package}")
-        print()
-        print("Install missing packages with:")
-        print(f"  pip install {' '.join(missing_modules)}")
-        print()
-        print("Or install all requirements:")
-        print("  pip install -r requirements.txt")
-        print()
-        print("=" * 60)
+            logger.error("  - %s", package)
+        logger.error("")
+        logger.error("Install missing packages with:")
+        logger.error("  pip install %s", ' '.join(missing_modules))
+        logger.error("")
+        logger.error("Or install all requirements:")
+        logger.error("  pip install -r requirements.txt")
+        logger.error("")
+        logger.error("=" * 60)
         return False
     
     return True
@@ -274,49 +308,51 @@ def main():
     """Main application entry point with comprehensive error handling"""
     from config import Config
     
+    setup_logging()
+    
     # Print header
-    print()
-    print("=" * 60)
-    print(f"  {Config.APP_NAME} v{Config.APP_VERSION}")
-    print("=" * 60)
-    print()
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info("  %s v%s", Config.APP_NAME, Config.APP_VERSION)
+    logger.info("=" * 60)
+    logger.info("")
     
     # Check dependencies
-    print("Checking dependencies...")
+    logger.info("Checking dependencies...")
     if not check_dependencies():
         sys.exit(1)
-    print("✓ All dependencies installed")
-    print()
+    logger.info("✓ All dependencies installed")
+    logger.info("")
     
     # Initialize Firebase
-    print("Initializing Firebase...")
+    logger.info("Initializing Firebase...")
     if not initialize_firebase():
         sys.exit(1)
-    print("✓ Firebase initialized successfully")
-    print()
+    logger.info("")
     
     # Setup initial data
-    print("Setting up initial data...")
+    logger.info("Setting up initial data...")
     if not setup_initial_data():
-        print()
-        print("Warning: Some initialization steps failed")
-        print("The application will continue, but some features may not work")
-        print()
-    print("✓ Initial data setup complete")
-    print()
+        logger.warning("")
+        logger.warning("Warning: Some initialization steps failed")
+        logger.warning("The application will continue, but some features may not work")
+        logger.warning("")
+    logger.info("✓ Initial data setup complete")
+    logger.info("")
     
     # Application ready
-    print("=" * 60)
-    print("✓ Application ready!")
-    print("=" * 60)
-    print()
-    print("Default Admin Credentials:")
-    print("  Email: admin@carrental.com")
-    print("  Password: admin123")
-    print()
-    print("Starting GUI...")
-    print("=" * 60)
-    print()
+    logger.info("=" * 60)
+    logger.info("✓ Application ready!")
+    logger.info("=" * 60)
+    logger.info("")
+    logger.info("Default Admin Credentials:")
+    logger.info("  Email: admin@carrental.com")
+    logger.info("  Password: admin123")
+    logger.info("")
+    logger.info("Starting GUI...")
+    logger.info("=" * 60)
+    logger.info("")
+    end_startup_logging()
     
     # Start application
     start_application()
@@ -326,20 +362,20 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print("\n\nApplication terminated by user")
+        logger.info("\n\nApplication terminated by user")
         cleanup_and_exit(0)
     except SystemExit:
         # Allow sys.exit() calls to work normally
         raise
     except Exception as e:
-        print()
-        print("=" * 60)
-        print("FATAL ERROR: Unexpected error occurred!")
-        print("=" * 60)
-        print(f"Error: {str(e)}")
-        print()
-        print("Full traceback:")
-        traceback.print_exc()
-        print()
-        print("=" * 60)
+        logger.error("")
+        logger.error("=" * 60)
+        logger.error("FATAL ERROR: Unexpected error occurred!")
+        logger.error("=" * 60)
+        logger.error("Error: %s", e)
+        logger.error("")
+        logger.error("Full traceback:")
+        logger.error(traceback.format_exc().rstrip())
+        logger.error("")
+        logger.error("=" * 60)
         cleanup_and_exit(1)
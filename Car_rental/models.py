@@ -1,162 +1,184 @@
 """
 Data models for Car Rental System
 """
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Dict, Any
+from operator import itemgetter
+from sys import intern
+from typing import Optional, Dict, Any, Iterable
 
-class User:
-    def __init__(self, uid: str, email: str, name: str, role: str, 
-                 phone: str = "", address: str = "", created_at: datetime = None):
-        self.uid = uid
-        self.email = email
-        self.name = name
-        self.role = role  # 'admin' or 'customer'
-        self.phone = phone
-        self.address = address
-        self.created_at = created_at or datetime.now()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'uid': self.uid,
-            'email': self.email,
-            'name': self.name,
-            'role': self.role,
-            'phone': self.phone,
-            'address': self.address,
-            'created_at': self.created_at
-        }
+# from_dict defaults for keys missing from stored documents. Timestamp
+# fields are not listed; missing or empty (None) ones fall back to a single
+# datetime.now() call.
+_USER_DEFAULTS = {
+    'uid': '', 'email': '', 'name': '', 'role': 'customer',
+    'phone': '', 'address': ''
+}
+_CAR_DEFAULTS = {
+    'car_id': '', 'brand': '', 'model': '', 'year': 2024, 'daily_rate': 0.0,
+    'status': 'Available', 'color': '', 'fuel_type': '', 'seats': 5, 'image_url': ''
+}
+_BOOKING_DEFAULTS = {
+    'booking_id': '', 'customer_id': '', 'car_id': '', 'total_amount': 0.0,
+    'status': 'Active', 'customer_name': '', 'car_info': ''
+}
+_PAYMENT_DEFAULTS = {
+    'payment_id': '', 'booking_id': '', 'amount': 0.0,
+    'payment_method': 'Cash', 'status': 'Completed'
+}
+
+def _make_to_dict(cls, names):
+    """Generate a to_dict returning a dict display of the fields, like a hand-written one"""
+    source = "def to_dict(self):\n    return {%s}\n" % ", ".join(f"{name!r}: self.{name}" for name in names)
+    namespace = {}
+    exec(source, namespace)
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__annotations__ = {'return': Dict[str, Any]}
+    return to_dict
+
+def _stored_model(defaults: Dict[str, Any], timestamps=(), interned=()):
+    """Set up a dataclass as a stored model for both directions of storage.
     
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'User':
-        return User(
-            uid=data.get('uid', ''),
-            email=data.get('email', ''),
-            name=data.get('name', ''),
-            role=data.get('role', 'customer'),
-            phone=data.get('phone', ''),
-            address=data.get('address', ''),
-            created_at=data.get('created_at', datetime.now())
-        )
+    Attaches the field order, defaults, timestamp and interned fields that
+    the _StoredModel loaders read, and a to_dict generated over the same
+    field order.
+    """
+    def decorate(cls):
+        names = tuple(f.name for f in fields(cls))
+        cls._FIELDS = names
+        cls._VALUES = itemgetter(*names)
+        cls._DEFAULTS = defaults
+        cls._TIMESTAMP_FIELDS = frozenset(timestamps)
+        cls._TIMESTAMP_INDEXES = tuple(names.index(name) for name in timestamps)
+        cls._INTERNED_FIELDS = tuple(interned)
+        cls.to_dict = _make_to_dict(cls, names)
+        return cls
+    return decorate
 
-class Car:
-    def __init__(self, car_id: str, brand: str, model: str, year: int,
-                 daily_rate: float, status: str = "Available", 
-                 color: str = "", fuel_type: str = "", 
-                 seats: int = 5, image_url: str = ""):
-        self.car_id = car_id
-        self.brand = brand
-        self.model = model
-        self.year = year
-        self.daily_rate = daily_rate
-        self.status = status  # 'Available' or 'Booked'
-        self.color = color
-        self.fuel_type = fuel_type
-        self.seats = seats
-        self.image_url = image_url
+class _StoredModel:
+    """Shared from_dict constructors for models persisted in Firestore"""
+    __slots__ = ()
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'car_id': self.car_id,
-            'brand': self.brand,
-            'model': self.model,
-            'year': self.year,
-            'daily_rate': self.daily_rate,
-            'status': self.status,
-            'color': self.color,
-            'fuel_type': self.fuel_type,
-            'seats': self.seats,
-            'image_url': self.image_url
-        }
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build a model from a stored dict in one merge plus a positional call"""
+        merged = {**cls._DEFAULTS, **data}
+        cls._fill_timestamps(merged, None)
+        return cls(*cls._VALUES(merged))._intern_fields()
     
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Car':
-        return Car(
-            car_id=data.get('car_id', ''),
-            brand=data.get('brand', ''),
-            model=data.get('model', ''),
-            year=data.get('year', 2024),
-            daily_rate=data.get('daily_rate', 0.0),
-            status=data.get('status', 'Available'),
-            color=data.get('color', ''),
-            fuel_type=data.get('fuel_type', ''),
-            seats=data.get('seats', 5),
-            image_url=data.get('image_url', '')
-        )
-
-class Booking:
-    def __init__(self, booking_id: str, customer_id: str, car_id: str,
-                 start_date: datetime, end_date: datetime, 
-                 total_amount: float, status: str = "Active",
-                 customer_name: str = "", car_info: str = "",
-                 created_at: datetime = None):
-        self.booking_id = booking_id
-        self.customer_id = customer_id
-        self.car_id = car_id
-        self.start_date = start_date
-        self.end_date = end_date
-        self.total_amount = total_amount
-        self.status = status  # 'Active', 'Completed', 'Cancelled'
-        self.customer_name = customer_name
-        self.car_info = car_info
-        self.created_at = created_at or datetime.now()
+    @classmethod
+    def _fill_timestamps(cls, merged: Dict[str, Any], now: Optional[datetime]) -> Optional[datetime]:
+        """Set missing or empty timestamp fields of merged to now (read once if None).
+        
+        Returns the now used, so callers can share it across rows.
+        """
+        for name in cls._TIMESTAMP_FIELDS:
+            if not merged.get(name):
+                if now is None:
+                    now = datetime.now()
+                merged[name] = now
+        return now
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'booking_id': self.booking_id,
-            'customer_id': self.customer_id,
-            'car_id': self.car_id,
-            'start_date': self.start_date,
-            'end_date': self.end_date,
-            'total_amount': self.total_amount,
-            'status': self.status,
-            'customer_name': self.customer_name,
-            'car_info': self.car_info,
-            'created_at': self.created_at
-        }
+    @classmethod
+    def _has_timestamps(cls, row: tuple) -> bool:
+        """Whether every timestamp in a positional row is set"""
+        for index in cls._TIMESTAMP_INDEXES:
+            if not row[index]:
+                return False
+        return True
     
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Booking':
-        return Booking(
-            booking_id=data.get('booking_id', ''),
-            customer_id=data.get('customer_id', ''),
-            car_id=data.get('car_id', ''),
-            start_date=data.get('start_date', datetime.now()),
-            end_date=data.get('end_date', datetime.now()),
-            total_amount=data.get('total_amount', 0.0),
-            status=data.get('status', 'Active'),
-            customer_name=data.get('customer_name', ''),
-            car_info=data.get('car_info', ''),
-            created_at=data.get('created_at', datetime.now())
-        )
-
-class Payment:
-    def __init__(self, payment_id: str, booking_id: str, amount: float,
-                 payment_date: datetime, payment_method: str = "Cash",
-                 status: str = "Completed"):
-        self.payment_id = payment_id
-        self.booking_id = booking_id
-        self.amount = amount
-        self.payment_date = payment_date
-        self.payment_method = payment_method
-        self.status = status
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]):
+        """Build a model from a dict written by to_dict, skipping defaults.
+        
+        Falls back to from_dict if the document is missing any field.
+        """
+        try:
+            row = cls._VALUES(data)
+        except KeyError:
+            return cls.from_dict(data)
+        if not cls._has_timestamps(row):
+            return cls.from_dict(data)
+        return cls(*row)._intern_fields()
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'payment_id': self.payment_id,
-            'booking_id': self.booking_id,
-            'amount': self.amount,
-            'payment_date': self.payment_date,
-            'payment_method': self.payment_method,
-            'status': self.status
-        }
+    @classmethod
+    def from_dict_many(cls, rows: Iterable[Dict[str, Any]]) -> list:
+        """Build models from many stored dicts, as from_trusted_dict does per row.
+        
+        Rows missing a timestamp all share one datetime.now() reading.
+        """
+        values, defaults, has_timestamps = cls._VALUES, cls._DEFAULTS, cls._has_timestamps
+        now = None
+        models = []
+        for data in rows:
+            try:
+                row = values(data)
+                complete = has_timestamps(row)
+            except KeyError:
+                complete = False
+            if not complete:
+                merged = {**defaults, **data}
+                now = cls._fill_timestamps(merged, now)
+                row = values(merged)
+            models.append(cls(*row)._intern_fields())
+        return models
     
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Payment':
-        return Payment(
-            payment_id=data.get('payment_id', ''),
-            booking_id=data.get('booking_id', ''),
-            amount=data.get('amount', 0.0),
-            payment_date=data.get('payment_date', datetime.now()),
-            payment_method=data.get('payment_method', 'Cash'),
-            status=data.get('status', 'Completed')
-        )
+    def _intern_fields(self):
+        """Intern low-cardinality string fields (role, status, ...) shared across rows"""
+        for name in self._INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, intern(value))
+        return self
+
+@_stored_model(_USER_DEFAULTS, timestamps=('created_at',), interned=('role',))
+@dataclass(slots=True)
+class User(_StoredModel):
+    uid: str
+    email: str
+    name: str
+    role: str  # 'admin' or 'customer'
+    phone: str = ""
+    address: str = ""
+    created_at: datetime = field(default_factory=datetime.now)
+
+@_stored_model(_CAR_DEFAULTS, interned=('status', 'fuel_type'))
+@dataclass(slots=True)
+class Car(_StoredModel):
+    car_id: str
+    brand: str
+    model: str
+    year: int
+    daily_rate: float
+    status: str = "Available"  # 'Available' or 'Booked'
+    color: str = ""
+    fuel_type: str = ""
+    seats: int = 5
+    image_url: str = ""
+
+@_stored_model(_BOOKING_DEFAULTS, timestamps=('start_date', 'end_date', 'created_at'),
+                  interned=('status',))
+@dataclass(slots=True)
+class Booking(_StoredModel):
+    booking_id: str
+    customer_id: str
+    car_id: str
+    start_date: datetime
+    end_date: datetime
+    total_amount: float
+    status: str = "Active"  # 'Active', 'Completed', 'Cancelled'
+    customer_name: str = ""
+    car_info: str = ""
+    created_at: datetime = field(default_factory=datetime.now)
+
+@_stored_model(_PAYMENT_DEFAULTS, timestamps=('payment_date',),
+                  interned=('payment_method', 'status'))
+@dataclass(slots=True)
+class Payment(_StoredModel):
+    payment_id: str
+    booking_id: str
+    amount: float
+    payment_date: datetime
+    payment_method: str = "Cash"
+    status: str = "Completed"
@@ -3,38 +3,188 @@ Admin Dashboard for Car Rental System
 Complete version with all bug fixes and proper button visibility
 """
 import customtkinter as ctk
+import dataclasses
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from database import Database
 from models import Car, Booking, Payment
 from ui.components import (ModernButton, ModernEntry, ModernLabel, ModernFrame,
-                          Card, DataTable, show_message, ask_confirmation)
-from config import Config
+                          Card, DataTable, FuturePoller, LazyGrid, center_on_screen,
+                          show_message, ask_confirmation)
+from config import Config, FONTS
 import utils
 
+logger = logging.getLogger(__name__)
 
-class AdminDashboard(ctk.CTkToplevel):
+
+class AdminDashboard(FuturePoller, ctk.CTkToplevel):
     """Admin dashboard window"""
-    def __init__(self, parent, user):
+    # Seconds a cached list is reused even if nothing changed locally
+    CACHE_TTL = 60
+    # Car cards built per step of the lazy car grid (about one screen)
+    CAR_CARDS_PER_SCREEN = 4
+    # Car cards built per Tk event-loop turn, so the window stays responsive
+    CAR_CARDS_PER_BATCH = 2
+    # Reports grid cards as (title, dashboard stats key)
+    REPORT_FIELDS = [
+        ("Total Cars", 'total_cars'),
+        ("Available Cars", 'available_cars'),
+        ("Booked Cars", 'booked_cars'),
+        ("Total Bookings", 'total_bookings'),
+        ("Active Bookings", 'active_bookings'),
+        ("Total Customers", 'total_customers'),
+        ("Total Revenue", 'total_revenue'),
+    ]
+    
+    def __init__(self, parent, user, on_logout=None):
         super().__init__(parent)
         
         self.user = user
-        self.db = Database()
+        # Called after logout hides the window, so the login screen can come back
+        self._on_logout = on_logout
+        self.db = Database.get()
+        
+        # Lists shown by the sidebar views, keyed by (name, version);
+        # bumping a version after a write makes the next view reload it
+        self._cache = {}
+        # ('stats' has no list; it only versions the views showing counts)
+        self._cache_ver = {'cars': 0, 'bookings': 0, 'customers': 0, 'payments': 0, 'stats': 0}
+        self._cache_lock = threading.Lock()
+        
+        # Fetchers for the views; the Database getters log a failed read
+        # and return an empty result, so a failure shows as an empty view
+        self._fetch_stats = self.db.get_dashboard_stats
+        self._fetch_recent_bookings = self.db.get_recent_bookings
+        self._fetchers = {
+            'cars': self.db.get_all_cars,
+            'bookings': self.db.get_all_bookings,
+            'customers': self.db.get_all_customers,
+            'payments': self.db.get_all_payments,
+        }
+        
+        # Database reads for the views run here, off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        
+        # Built views by name, as (list versions, build time, frame)
+        self._views = {}
+        # Reports grid value labels by stats key, filled in when it is built
+        self._report_values = {}
+        self._pending_stats = {}
+        self._stats_flush_scheduled = False
+        
+        # Card grid of the cars view, set once its list has loaded
+        self._car_grid = None
+        
+        # Screen size does not change during a session; read it once
+        self._screen_w = self.winfo_screenwidth()
+        self._screen_h = self.winfo_screenheight()
         
         self.title(f"{Config.APP_NAME} - Admin Dashboard")
-        self.geometry(f"{Config.WINDOW_WIDTH}x{Config.WINDOW_HEIGHT}")
         
-        # Center window
+        # Size and center window
         self.center_window()
         
         # Create UI
         self.create_dashboard_ui()
     
+    def _cached(self, name, loader):
+        """Return the cached list for name, calling loader if it is missing or stale"""
+        with self._cache_lock:
+            key = (name, self._cache_ver[name])
+            entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.CACHE_TTL:
+            return entry[1]
+        
+        data = loader()
+        self._store(key, data)
+        return data
+    
+    def _peek(self, name):
+        """Return the cached list for name if it is fresh, else None"""
+        with self._cache_lock:
+            entry = self._cache.get((name, self._cache_ver[name]))
+        if entry is not None and time.monotonic() - entry[0] < self.CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _load_async(self, parent, name, render):
+        """Load a view's list on the executor and render it when it arrives.
+        
+        Renders straight away if the list is cached; otherwise a loading label
+        is shown in parent until the result is ready.
+        """
+        data = self._peek(name)
+        if data is not None:
+            render(data)
+            return
+        
+        spinner = ctk.CTkLabel(
+            parent,
+            text="Loading...",
+            font=FONTS.body,
+            text_color="gray"
+        )
+        spinner.pack(pady=50)
+        
+        future = self._executor.submit(self._cached, name, self._fetchers[name])
+        self._await(future, spinner, render)
+    
+    def _await(self, future, spinner, render):
+        """Swap the loading label for the data once a load finishes"""
+        def finish(data):
+            # The user moved to another view while this was loading
+            if not spinner.winfo_exists():
+                return
+            spinner.destroy()
+            render(data)
+        
+        def failed(error):
+            if spinner.winfo_exists():
+                spinner.configure(text="Failed to load data")
+        
+        self._poll(future, finish, failed)
+    
+    def _store(self, key, data):
+        """Cache data unless its list was invalidated while it was loading"""
+        with self._cache_lock:
+            name, version = key
+            if self._cache_ver[name] == version:
+                self._cache[key] = (time.monotonic(), data)
+    
+    def _invalidate(self, *names):
+        """Drop cached lists after a successful write"""
+        with self._cache_lock:
+            for name in names:
+                self._cache.pop((name, self._cache_ver[name]), None)
+                self._cache_ver[name] += 1
+    
+    def _patch_cached(self, name, data):
+        """Swap in a locally edited copy of a cached list, keeping its version.
+        
+        Views built from the list stay pooled; the caller patches them too.
+        """
+        with self._cache_lock:
+            key = (name, self._cache_ver[name])
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache[key] = (entry[0], data)
+    
+    def _prefetch_tabs(self):
+        """Load the other views' lists in the background (no Tk calls here)"""
+        for name, fetch in self._fetchers.items():
+            with self._cache_lock:
+                key = (name, self._cache_ver[name])
+                if key in self._cache:
+                    continue
+            self._store(key, fetch())
+    
     def center_window(self):
         """Center window on screen"""
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() // 2) - (Config.WINDOW_WIDTH // 2)
-        y = (self.winfo_screenheight() // 2) - (Config.WINDOW_HEIGHT // 2)
-        self.geometry(f'{Config.WINDOW_WIDTH}x{Config.WINDOW_HEIGHT}+{x}+{y}')
+        center_on_screen(self, Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT,
+                         self._screen_w, self._screen_h)
     
     def create_dashboard_ui(self):
         """Create main dashboard UI"""
@@ -51,6 +201,9 @@ class AdminDashboard(ctk.CTkToplevel):
         
         # Show home by default
         self.show_home()
+        
+        # Warm the other tabs while the user looks at the dashboard
+        threading.Thread(target=self._prefetch_tabs, daemon=True).start()
     
     def create_sidebar(self, parent):
         """Create sidebar navigation"""
@@ -65,14 +218,14 @@ class AdminDashboard(ctk.CTkToplevel):
         icon_label = ctk.CTkLabel(
             header_frame,
             text="🚗",
-            font=("Roboto", 40)
+            font=FONTS.icon
         )
         icon_label.pack()
         
         title_label = ctk.CTkLabel(
             header_frame,
             text="Admin Panel",
-            font=("Roboto", 20, "bold"),
+            font=FONTS.subtitle,
             text_color="white"
         )
         title_label.pack()
@@ -81,13 +234,13 @@ class AdminDashboard(ctk.CTkToplevel):
         user_frame = ctk.CTkFrame(sidebar, fg_color=Config.SECONDARY_COLOR, corner_radius=10)
         user_frame.pack(pady=20, padx=15, fill="x")
         
-        user_label = ctk.CTkLabel(
+        self._user_label = ctk.CTkLabel(
             user_frame,
             text=f"👤 {self.user.name}",
-            font=("Roboto", 14),
+            font=FONTS.body,
             text_color="white"
         )
-        user_label.pack(pady=15)
+        self._user_label.pack(pady=15)
         
         # Navigation buttons
         nav_buttons = [
@@ -109,7 +262,7 @@ class AdminDashboard(ctk.CTkToplevel):
                 hover_color=Config.SECONDARY_COLOR,
                 anchor="w",
                 height=45,
-                font=("Roboto", 14)
+                font=FONTS.body
             )
             btn.pack(pady=5, padx=15, fill="x")
         
@@ -121,37 +274,72 @@ class AdminDashboard(ctk.CTkToplevel):
             fg_color=Config.DANGER_COLOR,
             hover_color="#c0392b",
             height=45,
-            font=("Roboto", 14, "bold")
+            font=FONTS.body_bold
         )
         logout_btn.pack(side="bottom", pady=20, padx=15, fill="x")
     
     def clear_content(self):
-        """Clear content frame"""
+        """Hide the current view; built views are kept for reuse by _open_view"""
         for widget in self.content_frame.winfo_children():
-            widget.destroy()
+            widget.pack_forget()
+    
+    def _open_view(self, name, *depends):
+        """Switch to a view, reusing its widgets if the lists it shows are unchanged.
+        
+        Returns a fresh frame to build the view into, or None if the pooled
+        view was shown again as is.
+        """
+        self.clear_content()
+        
+        key = tuple(self._cache_ver[dep] for dep in depends)
+        pooled = self._views.get(name)
+        if pooled is not None:
+            pooled_key, built_at, view = pooled
+            if pooled_key == key and time.monotonic() - built_at < self.CACHE_TTL:
+                view.pack(fill="both", expand=True)
+                return None
+            view.destroy()
+        
+        view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        view.pack(fill="both", expand=True)
+        self._views[name] = (key, time.monotonic(), view)
+        return view
     
     def show_home(self):
         """Show home/dashboard with statistics"""
-        self.clear_content()
+        view = self._open_view('home', 'bookings', 'cars', 'stats')
+        if view is None:
+            return
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="Dashboard Overview",
-            font=("Roboto", 28, "bold"),
+            font=FONTS.header,
             text_color=Config.PRIMARY_COLOR
         )
         header.pack(pady=30, padx=30, anchor="w")
         
-        try:
-            # Get statistics
-            stats = self.db.get_dashboard_stats()
-        except Exception as e:
-            print(f"Error loading dashboard stats: {e}")
-            stats = {}
+        # Statistics and recent bookings load on the executor
+        spinner = ctk.CTkLabel(
+            view,
+            text="Loading...",
+            font=FONTS.body,
+            text_color="gray"
+        )
+        spinner.pack(pady=50)
         
+        future = self._executor.submit(self._fetch_home)
+        self._await(future, spinner, lambda data: self._render_home(view, *data))
+    
+    def _fetch_home(self):
+        """The home view's statistics and its ten most recent bookings (runs on the executor)"""
+        return self._fetch_stats(), self._fetch_recent_bookings(10)
+    
+    def _render_home(self, view, stats, bookings):
+        """Fill the home view with its statistics cards and recent bookings"""
         # Statistics cards
-        stats_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        stats_frame = ctk.CTkFrame(view, fg_color="transparent")
         stats_frame.pack(pady=20, padx=30, fill="x")
         
         cards_data = [
@@ -166,23 +354,17 @@ class AdminDashboard(ctk.CTkToplevel):
             card.pack(side="left", padx=10, pady=10, fill="both", expand=True)
         
         # Recent bookings
-        bookings_frame = ModernFrame(self.content_frame)
+        bookings_frame = ModernFrame(view)
         bookings_frame.pack(pady=20, padx=30, fill="both", expand=True)
         
         bookings_title = ctk.CTkLabel(
             bookings_frame,
             text="Recent Bookings",
-            font=("Roboto", 18, "bold")
+            font=FONTS.section
         )
         bookings_title.pack(pady=15, padx=20, anchor="w")
         
-        try:
-            # Bookings table
-            bookings = self.db.get_all_bookings()[:10]  # Latest 10
-        except Exception as e:
-            print(f"Error loading bookings: {e}")
-            bookings = []
-        
+        # Bookings table
         if bookings:
             table = DataTable(
                 bookings_frame,
@@ -191,37 +373,46 @@ class AdminDashboard(ctk.CTkToplevel):
             )
             table.pack(pady=10, padx=20, fill="both", expand=True)
             
-            for booking in bookings:
-                table.add_row([
+            # Format each column in one pass
+            starts = utils.format_date_all(booking.start_date for booking in bookings)
+            ends = utils.format_date_all(booking.end_date for booking in bookings)
+            amounts = utils.format_currency_all(booking.total_amount for booking in bookings)
+            
+            table.add_rows([
+                [
                     booking.booking_id,
                     booking.customer_name,
                     booking.car_info,
-                    utils.format_date(booking.start_date),
-                    utils.format_date(booking.end_date),
-                    utils.format_currency(booking.total_amount),
+                    start,
+                    end,
+                    amount,
                     booking.status
-                ])
+                ]
+                for booking, start, end, amount in zip(bookings, starts, ends, amounts)
+            ])
         else:
             no_data_label = ctk.CTkLabel(
                 bookings_frame,
                 text="No bookings found",
-                font=("Roboto", 14),
+                font=FONTS.body,
                 text_color="gray"
             )
             no_data_label.pack(pady=50)
     
     def show_cars(self):
         """Show car management interface with grid layout"""
-        self.clear_content()
+        view = self._open_view('cars', 'cars')
+        if view is None:
+            return
         
         # Header
-        header_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        header_frame = ctk.CTkFrame(view, fg_color="transparent")
         header_frame.pack(pady=30, padx=30, fill="x")
         
         header = ctk.CTkLabel(
             header_frame,
             text="Manage Cars",
-            font=("Roboto", 28, "bold"),
+            font=FONTS.header,
             text_color=Config.PRIMARY_COLOR
         )
         header.pack(side="left")
@@ -237,39 +428,78 @@ class AdminDashboard(ctk.CTkToplevel):
         
         # Cars grid with scrollable frame
         cars_scroll = ctk.CTkScrollableFrame(
-            self.content_frame,
+            view,
             fg_color="transparent",
             scrollbar_button_color=Config.PRIMARY_COLOR
         )
         cars_scroll.pack(pady=20, padx=30, fill="both", expand=True)
         
-        try:
-            cars = self.db.get_all_cars()
-        except Exception as e:
-            print(f"Error loading cars: {e}")
-            cars = []
-        
-        if cars:
-            # Create grid of car cards
-            for i, car in enumerate(cars):
-                row = i // 2
-                col = i % 2
-                
-                car_card = self.create_car_card(cars_scroll, car)
-                car_card.grid(row=row, column=col, padx=20, pady=20, sticky="nsew")
-            
-            # Configure grid weights
-            cars_scroll.grid_columnconfigure(0, weight=1, uniform="column")
-            cars_scroll.grid_columnconfigure(1, weight=1, uniform="column")
-        else:
+        self._load_async(cars_scroll, 'cars',
+                         lambda cars: self._render_cars(cars_scroll, cars))
+    
+    def _render_cars(self, cars_scroll, cars):
+        """Fill the cars view once its list has loaded"""
+        self._car_grid = LazyGrid(
+            cars_scroll, cars, self.create_car_card, columns=2,
+            per_screen=self.CAR_CARDS_PER_SCREEN,
+            per_batch=self.CAR_CARDS_PER_BATCH, pad=20
+        )
+        
+        if not cars:
             no_data_label = ctk.CTkLabel(
                 cars_scroll,
                 text="No cars found. Click 'Add New Car' to add one.",
-                font=("Roboto", 14),
+                font=FONTS.body,
                 text_color="gray"
             )
             no_data_label.pack(pady=50)
     
+    def _car_index(self, car_id):
+        """Position of a car in the grid, or None if the grid does not hold it"""
+        grid = self._car_grid
+        if grid is None or not grid.scroll.winfo_exists():
+            return None
+        return next((i for i, c in enumerate(grid.items) if c.car_id == car_id), None)
+    
+    def _update_car_card(self, car):
+        """Rebuild the one card for an edited car, in place"""
+        index = self._car_index(car.car_id)
+        if index is None:
+            return  # The grid is not showing this car; nothing to patch
+        self._car_grid.replace(index, car)
+        self._patch_cached('cars', list(self._car_grid.items))
+    
+    def _add_car_card(self, car):
+        """Append a card for a newly added car"""
+        grid = self._car_grid
+        if grid is None or not grid.scroll.winfo_exists():
+            return  # The cars view is still loading and will fetch the new car
+        grid.append(car)
+        self._patch_cached('cars', list(grid.items))
+        
+        if len(grid.items) == 1:
+            # Replace the "No cars found" placeholder with a fresh grid
+            self._rebuild_cars_view()
+    
+    def _remove_car_card(self, car_id):
+        """Drop a deleted car's card and shift the cards after it up one slot"""
+        index = self._car_index(car_id)
+        if index is None:
+            return  # The grid is not showing this car; nothing to patch
+        grid = self._car_grid
+        grid.remove(index)
+        self._patch_cached('cars', list(grid.items))
+        
+        if not grid.items:
+            self._rebuild_cars_view()
+    
+    def _rebuild_cars_view(self):
+        """Throw away the pooled cars view and build it again from the cached list"""
+        pooled = self._views.pop('cars', None)
+        if pooled is not None:
+            pooled[2].destroy()
+        self.show_cars()
+    
     def create_car_card(self, parent, car):
         """Create a card for displaying car with edit/delete buttons"""
         # Main card frame
@@ -283,7 +513,7 @@ class AdminDashboard(ctk.CTkToplevel):
         icon_label = ctk.CTkLabel(
             content,
             text="🚗",
-            font=("Roboto", 50)
+            font=FONTS.icon_large
         )
         icon_label.pack(pady=(10, 5))
         
@@ -291,7 +521,7 @@ class AdminDashboard(ctk.CTkToplevel):
         name_label = ctk.CTkLabel(
             content,
             text=f"{car.brand} {car.model}",
-            font=("Roboto", 20, "bold")
+            font=FONTS.subtitle
         )
         name_label.pack(pady=5)
         
@@ -299,7 +529,7 @@ class AdminDashboard(ctk.CTkToplevel):
         id_label = ctk.CTkLabel(
             content,
             text=f"ID: {car.car_id}",
-            font=("Roboto", 10),
+            font=FONTS.tiny,
             text_color="gray"
         )
         id_label.pack(pady=2)
@@ -312,43 +542,27 @@ class AdminDashboard(ctk.CTkToplevel):
         details_frame = ctk.CTkFrame(content, fg_color="transparent")
         details_frame.pack(pady=10, fill="x")
         
-        # Left column
-        left_col = ctk.CTkFrame(details_frame, fg_color="transparent")
-        left_col.pack(side="left", fill="x", expand=True)
-        
-        details_left = [
-            f"📅 Year: {car.year}",
-            f"🎨 Color: {car.color}",
-            f"⛽ Fuel: {car.fuel_type}",
-        ]
-        
-        for detail in details_left:
-            detail_label = ctk.CTkLabel(
-                left_col,
-                text=detail,
-                font=("Roboto", 11),
-                anchor="w"
-            )
-            detail_label.pack(anchor="w", pady=3)
-        
-        # Right column
-        right_col = ctk.CTkFrame(details_frame, fg_color="transparent")
-        right_col.pack(side="right", fill="x", expand=True)
-        
-        details_right = [
-            f"👥 Seats: {car.seats}",
-            f"📊 Status: {car.status}",
-            f"",  # Empty for alignment
-        ]
+        # One multi-line label per column instead of a label per detail
+        details_left = ctk.CTkLabel(
+            details_frame,
+            text=f"📅 Year: {car.year}\n🎨 Color: {car.color}\n⛽ Fuel: {car.fuel_type}",
+            font=FONTS.small,
+            justify="left",
+            anchor="w"
+        )
+        details_left.grid(row=0, column=0, sticky="w")
+        
+        details_right = ctk.CTkLabel(
+            details_frame,
+            text=f"👥 Seats: {car.seats}\n📊 Status: {car.status}",
+            font=FONTS.small,
+            justify="left",
+            anchor="nw"
+        )
+        details_right.grid(row=0, column=1, sticky="nw")
         
-        for detail in details_right:
-            detail_label = ctk.CTkLabel(
-                right_col,
-                text=detail,
-                font=("Roboto", 11),
-                anchor="w"
-            )
-            detail_label.pack(anchor="w", pady=3)
+        details_frame.grid_columnconfigure(0, weight=1)
+        details_frame.grid_columnconfigure(1, weight=1)
         
         # Price
         price_frame = ctk.CTkFrame(content, fg_color=Config.SUCCESS_COLOR, corner_radius=8)
@@ -357,7 +571,7 @@ class AdminDashboard(ctk.CTkToplevel):
         price_label = ctk.CTkLabel(
             price_frame,
             text=f"{utils.format_currency(car.daily_rate)}/day",
-            font=("Roboto", 18, "bold"),
+            font=FONTS.section,
             text_color="white"
         )
         price_label.pack(pady=10)
@@ -375,7 +589,7 @@ class AdminDashboard(ctk.CTkToplevel):
             hover_color=Config.SECONDARY_COLOR,
             width=120,
             height=35,
-            font=("Roboto", 13, "bold"),
+            font=FONTS.button,
             corner_radius=8
         )
         edit_btn.pack(side="left", padx=5, expand=True, fill="x")
@@ -389,7 +603,7 @@ class AdminDashboard(ctk.CTkToplevel):
             hover_color="#c0392b",
             width=120,
             height=35,
-            font=("Roboto", 13, "bold"),
+            font=FONTS.button,
             corner_radius=8
         )
         delete_btn.pack(side="right", padx=5, expand=True, fill="x")
@@ -411,16 +625,10 @@ class AdminDashboard(ctk.CTkToplevel):
         
         dialog = ctk.CTkToplevel(self)
         dialog.title(title)
-        dialog.geometry("550x750")
+        center_on_screen(dialog, 550, 750, self._screen_w, self._screen_h)
         dialog.transient(self)
         dialog.grab_set()
         
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (550 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (750 // 2)
-        dialog.geometry(f"550x750+{x}+{y}")
-        
         # Form
         form_frame = ctk.CTkScrollableFrame(dialog)
         form_frame.pack(fill="both", expand=True, padx=30, pady=30)
@@ -429,7 +637,7 @@ class AdminDashboard(ctk.CTkToplevel):
         form_title = ctk.CTkLabel(
             form_frame,
             text=title,
-            font=("Roboto", 24, "bold"),
+            font=FONTS.title,
             text_color=Config.PRIMARY_COLOR
         )
         form_title.pack(pady=(0, 20))
@@ -447,6 +655,17 @@ class AdminDashboard(ctk.CTkToplevel):
             ("Seats *", "seats", "Enter number of seats (1-50)"),
         ]
         
+        # Current values to pre-fill when editing
+        prefill = {
+            'brand': car.brand,
+            'model': car.model,
+            'year': car.year,
+            'daily_rate': car.daily_rate,
+            'color': car.color,
+            'fuel_type': car.fuel_type,
+            'seats': car.seats,
+        } if is_edit else None
+        
         for label_text, field_name, placeholder in field_configs:
             label = ModernLabel(form_frame, text=label_text, size=13, bold=True)
             label.pack(anchor="w", pady=(15, 5))
@@ -454,22 +673,8 @@ class AdminDashboard(ctk.CTkToplevel):
             entry = ModernEntry(form_frame, placeholder=placeholder, width=450)
             entry.pack(pady=(0, 10), fill="x")
             
-            # Pre-fill if editing
-            if is_edit:
-                if field_name == "brand":
-                    entry.insert(0, car.brand)
-                elif field_name == "model":
-                    entry.insert(0, car.model)
-                elif field_name == "year":
-                    entry.insert(0, str(car.year))
-                elif field_name == "daily_rate":
-                    entry.insert(0, str(car.daily_rate))
-                elif field_name == "color":
-                    entry.insert(0, car.color)
-                elif field_name == "fuel_type":
-                    entry.insert(0, car.fuel_type)
-                elif field_name == "seats":
-                    entry.insert(0, str(car.seats))
+            if prefill:
+                entry.insert(0, str(prefill[field_name]))
             
             fields[field_name] = entry
         
@@ -485,7 +690,7 @@ class AdminDashboard(ctk.CTkToplevel):
                 variable=status_var,
                 width=450,
                 height=40,
-                font=("Roboto", 12),
+                font=FONTS.text,
                 fg_color=Config.PRIMARY_COLOR,
                 button_color=Config.SECONDARY_COLOR
             )
@@ -496,7 +701,7 @@ class AdminDashboard(ctk.CTkToplevel):
         note_label = ctk.CTkLabel(
             form_frame,
             text="* Required fields",
-            font=("Roboto", 10),
+            font=FONTS.tiny,
             text_color="gray"
         )
         note_label.pack(pady=(10, 20))
@@ -508,29 +713,25 @@ class AdminDashboard(ctk.CTkToplevel):
         def save_car():
             """Save or update car"""
             try:
-                brand = fields['brand'].get().strip()
-                model = fields['model'].get().strip()
-                year_str = fields['year'].get().strip()
-                rate_str = fields['daily_rate'].get().strip()
-                color = fields['color'].get().strip()
-                fuel_type = fields['fuel_type'].get().strip()
-                seats_str = fields['seats'].get().strip()
+                # Read every entry once; the dict is reused as the car data below
+                values = {name: fields[name].get().strip() for _, name, _ in field_configs}
                 
                 # Validation
-                if not all([brand, model, year_str, rate_str, color, fuel_type, seats_str]):
+                if any(not value for value in values.values()):
                     show_message(dialog, "Error", "Please fill all required fields", "error")
                     return
                 
                 try:
-                    year = int(year_str)
-                    daily_rate = float(rate_str)
-                    seats = int(seats_str)
+                    year = values['year'] = int(values['year'])
+                    daily_rate = values['daily_rate'] = float(values['daily_rate'])
+                    seats = values['seats'] = int(values['seats'])
                 except ValueError:
                     show_message(dialog, "Error", "Year, Rate, and Seats must be valid numbers", "error")
                     return
                 
-                if year < 1900 or year > datetime.now().year + 1:
-                    show_message(dialog, "Error", f"Year must be between 1900 and {datetime.now().year + 1}", "error")
+                max_year = datetime.now().year + 1
+                if year < 1900 or year > max_year:
+                    show_message(dialog, "Error", f"Year must be between 1900 and {max_year}", "error")
                     return
                 
                 if daily_rate <= 0:
@@ -543,47 +744,33 @@ class AdminDashboard(ctk.CTkToplevel):
                 
                 if is_edit:
                     # Update existing car
-                    status = fields['status'].get()
-                    update_data = {
-                        'brand': brand,
-                        'model': model,
-                        'year': year,
-                        'daily_rate': daily_rate,
-                        'color': color,
-                        'fuel_type': fuel_type,
-                        'seats': seats,
-                        'status': status
-                    }
+                    update_data = {**values, 'status': fields['status'].get()}
                     
                     if self.db.update_car(car.car_id, update_data):
-                        show_message(dialog, "Success", f"Car {brand} {model} updated successfully!", "success")
+                        self._invalidate('stats')
+                        show_message(dialog, "Success", f"Car {values['brand']} {values['model']} updated successfully!", "success")
                         dialog.destroy()
-                        self.show_cars()
+                        self._update_car_card(dataclasses.replace(car, **update_data))
                     else:
                         show_message(dialog, "Error", "Failed to update car. Please try again.", "error")
                 else:
                     # Create new car
                     new_car = Car(
                         car_id=self.db.generate_id("CAR_"),
-                        brand=brand,
-                        model=model,
-                        year=year,
-                        daily_rate=daily_rate,
                         status="Available",
-                        color=color,
-                        fuel_type=fuel_type,
-                        seats=seats
+                        **values
                     )
                     
                     if self.db.add_car(new_car):
-                        show_message(dialog, "Success", f"Car {brand} {model} added successfully!", "success")
+                        self._invalidate('stats')
+                        show_message(dialog, "Success", f"Car {values['brand']} {values['model']} added successfully!", "success")
                         dialog.destroy()
-                        self.show_cars()
+                        self._add_car_card(new_car)
                     else:
                         show_message(dialog, "Error", "Failed to add car. Please try again.", "error")
                     
             except Exception as e:
-                print(f"Error saving car: {e}")
+                logger.exception("Error saving car")
                 show_message(dialog, "Error", f"An error occurred: {str(e)}", "error")
         
         save_btn = ctk.CTkButton(
@@ -594,7 +781,7 @@ class AdminDashboard(ctk.CTkToplevel):
             height=45,
             fg_color=Config.SUCCESS_COLOR,
             hover_color="#27ae60",
-            font=("Roboto", 14, "bold"),
+            font=FONTS.body_bold,
             corner_radius=8
         )
         save_btn.pack(side="left", padx=10)
@@ -607,7 +794,7 @@ class AdminDashboard(ctk.CTkToplevel):
             height=45,
             fg_color="gray",
             hover_color="darkgray",
-            font=("Roboto", 14, "bold"),
+            font=FONTS.body_bold,
             corner_radius=8
         )
         cancel_btn.pack(side="left", padx=10)
@@ -621,37 +808,39 @@ class AdminDashboard(ctk.CTkToplevel):
         ):
             try:
                 if self.db.delete_car(car.car_id):
+                    self._invalidate('stats')
                     show_message(self, "Success", f"Car {car.brand} {car.model} deleted successfully!", "success")
-                    self.show_cars()
+                    self._remove_car_card(car.car_id)
                 else:
                     show_message(self, "Error", "Failed to delete car. It may be associated with bookings.", "error")
             except Exception as e:
-                print(f"Error deleting car: {e}")
+                logger.exception("Error deleting car")
                 show_message(self, "Error", f"An error occurred: {str(e)}", "error")
     
     def show_bookings(self):
         """Show all bookings"""
-        self.clear_content()
+        view = self._open_view('bookings', 'bookings')
+        if view is None:
+            return
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="All Bookings",
-            font=("Roboto", 28, "bold"),
+            font=FONTS.header,
             text_color=Config.PRIMARY_COLOR
         )
         header.pack(pady=30, padx=30, anchor="w")
         
         # Bookings table
-        bookings_frame = ModernFrame(self.content_frame)
+        bookings_frame = ModernFrame(view)
         bookings_frame.pack(pady=20, padx=30, fill="both", expand=True)
         
-        try:
-            bookings = self.db.get_all_bookings()
-        except Exception as e:
-            print(f"Error loading bookings: {e}")
-            bookings = []
-        
+        self._load_async(bookings_frame, 'bookings',
+                         lambda bookings: self._render_bookings(bookings_frame, bookings))
+    
+    def _render_bookings(self, bookings_frame, bookings):
+        """Fill the bookings view once its list has loaded"""
         if bookings:
             table = DataTable(
                 bookings_frame,
@@ -660,25 +849,32 @@ class AdminDashboard(ctk.CTkToplevel):
             )
             table.pack(pady=20, padx=20, fill="both", expand=True)
             
-            for booking in bookings:
-                table.add_row(
+            # Format each column in one pass
+            starts = utils.format_date_all(booking.start_date for booking in bookings)
+            ends = utils.format_date_all(booking.end_date for booking in bookings)
+            amounts = utils.format_currency_all(booking.total_amount for booking in bookings)
+            
+            table.add_rows(
+                (
                     [
                         booking.booking_id,
                         booking.customer_name,
                         booking.car_info,
-                        utils.format_date(booking.start_date),
-                        utils.format_date(booking.end_date),
-                        utils.format_currency(booking.total_amount),
+                        start,
+                        end,
+                        amount,
                         booking.status
-                    ],
-                    button_text="Manage",
-                    button_command=lambda b=booking: self.manage_booking(b)
-                )
+                    ]
+                    for booking, start, end, amount in zip(bookings, starts, ends, amounts)
+                ),
+                button_text="Manage",
+                button_commands=[lambda b=booking: self.manage_booking(b) for booking in bookings]
+            )
         else:
             no_data_label = ctk.CTkLabel(
                 bookings_frame,
                 text="No bookings found",
-                font=("Roboto", 14),
+                font=FONTS.body,
                 text_color="gray"
             )
             no_data_label.pack(pady=50)
@@ -687,30 +883,24 @@ class AdminDashboard(ctk.CTkToplevel):
         """Manage booking actions"""
         dialog = ctk.CTkToplevel(self)
         dialog.title(f"Manage Booking - {booking.booking_id}")
-        dialog.geometry("450x350")
+        center_on_screen(dialog, 450, 350, self._screen_w, self._screen_h)
         dialog.transient(self)
         dialog.grab_set()
         
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (450 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (350 // 2)
-        dialog.geometry(f"450x350+{x}+{y}")
-        
         frame = ctk.CTkFrame(dialog)
         frame.pack(fill="both", expand=True, padx=30, pady=30)
         
         title = ctk.CTkLabel(
             frame,
             text=f"Booking {booking.booking_id}",
-            font=("Roboto", 20, "bold")
+            font=FONTS.subtitle
         )
         title.pack(pady=20)
         
         info = ctk.CTkLabel(
             frame,
             text=f"Customer: {booking.customer_name}\nCar: {booking.car_info}\nStatus: {booking.status}\nAmount: {utils.format_currency(booking.total_amount)}",
-            font=("Roboto", 12),
+            font=FONTS.text,
             justify="center"
         )
         info.pack(pady=10)
@@ -722,13 +912,14 @@ class AdminDashboard(ctk.CTkToplevel):
             def complete():
                 try:
                     if self.db.complete_booking(booking.booking_id):
+                        self._invalidate('bookings', 'cars')
                         show_message(dialog, "Success", "Booking completed successfully!", "success")
                         dialog.destroy()
                         self.show_bookings()
                     else:
                         show_message(dialog, "Error", "Failed to complete booking", "error")
                 except Exception as e:
-                    print(f"Error completing booking: {e}")
+                    logger.exception("Error completing booking")
                     show_message(dialog, "Error", f"Error: {str(e)}", "error")
             
             complete_btn = ModernButton(
@@ -750,27 +941,28 @@ class AdminDashboard(ctk.CTkToplevel):
     
     def show_customers(self):
         """Show all customers"""
-        self.clear_content()
+        view = self._open_view('customers', 'customers')
+        if view is None:
+            return
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="Customer Management",
-            font=("Roboto", 28, "bold"),
+            font=FONTS.header,
             text_color=Config.PRIMARY_COLOR
         )
         header.pack(pady=30, padx=30, anchor="w")
         
         # Customers table
-        customers_frame = ModernFrame(self.content_frame)
+        customers_frame = ModernFrame(view)
         customers_frame.pack(pady=20, padx=30, fill="both", expand=True)
         
-        try:
-            customers = self.db.get_all_customers()
-        except Exception as e:
-            print(f"Error loading customers: {e}")
-            customers = []
-        
+        self._load_async(customers_frame, 'customers',
+                         lambda customers: self._render_customers(customers_frame, customers))
+    
+    def _render_customers(self, customers_frame, customers):
+        """Fill the customers view once its list has loaded"""
         if customers:
             table = DataTable(
                 customers_frame,
@@ -779,145 +971,176 @@ class AdminDashboard(ctk.CTkToplevel):
             )
             table.pack(pady=20, padx=20, fill="both", expand=True)
             
-            for customer in customers:
-                table.add_row([
+            table.add_rows([
+                [
                     customer.uid,
                     customer.name,
                     customer.email,
                     customer.phone,
                     customer.address
-                ])
+                ]
+                for customer in customers
+            ])
         else:
             no_data_label = ctk.CTkLabel(
                 customers_frame,
                 text="No customers found",
-                font=("Roboto", 14),
+                font=FONTS.body,
                 text_color="gray"
             )
             no_data_label.pack(pady=50)
     
     def show_payments(self):
         """Show all payments"""
-        self.clear_content()
+        view = self._open_view('payments', 'payments')
+        if view is None:
+            return
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="Payment Records",
-            font=("Roboto", 28, "bold"),
+            font=FONTS.header,
             text_color=Config.PRIMARY_COLOR
         )
         header.pack(pady=30, padx=30, anchor="w")
         
         # Payments table
-        payments_frame = ModernFrame(self.content_frame)
+        payments_frame = ModernFrame(view)
         payments_frame.pack(pady=20, padx=30, fill="both", expand=True)
         
-        try:
-            payments = self.db.get_all_payments()
-        except Exception as e:
-            print(f"Error loading payments: {e}")
-            payments = []
-        
+        self._load_async(payments_frame, 'payments',
+                         lambda payments: self._render_payments(payments_frame, payments))
+    
+    def _render_payments(self, payments_frame, payments):
+        """Fill the payments view once its list has loaded"""
         if payments:
             table = DataTable(
                 payments_frame,
                 headers=["Payment ID", "Booking ID", "Amount", "Date", "Method", "Status"],
+                column_types=["text", "text", "currency", "text", "text", "text"],
                 height=500
             )
             table.pack(pady=20, padx=20, fill="both", expand=True)
             
-            for payment in payments:
-                table.add_row([
+            table.add_rows([
+                [
                     payment.payment_id,
                     payment.booking_id,
-                    utils.format_currency(payment.amount),
+                    payment.amount,
                     utils.format_datetime(payment.payment_date),
                     payment.payment_method,
                     payment.status
-                ])
+                ]
+                for payment in payments
+            ])
         else:
             no_data_label = ctk.CTkLabel(
                 payments_frame,
                 text="No payment records found",
-                font=("Roboto", 14),
+                font=FONTS.body,
                 text_color="gray"
             )
             no_data_label.pack(pady=50)
     
     def show_reports(self):
         """Show reports and analytics"""
-        self.clear_content()
+        pooled = self._views.get('reports')
+        if pooled is not None:
+            # The grid is built once; later visits only refresh the numbers
+            self.clear_content()
+            pooled[2].pack(fill="both", expand=True)
+            self._refresh_report_stats()
+            return
+        
+        view = self._open_view('reports')
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="Reports & Analytics",
-            font=("Roboto", 28, "bold"),
+            font=FONTS.header,
             text_color=Config.PRIMARY_COLOR
         )
-        header.pack(pady=30, padx=30, anchor="w")
+        header.grid(row=0, column=0, columnspan=2, pady=30, padx=30, sticky="w")
         
-        try:
-            # Get statistics
-            stats = self.db.get_dashboard_stats()
-        except Exception as e:
-            print(f"Error loading stats: {e}")
-            stats = {}
-        
-        # Report cards
-        report_frame = ModernFrame(self.content_frame)
-        report_frame.pack(pady=20, padx=30, fill="both", expand=True)
-        
-        report_data = [
-            ("Total Cars", stats.get('total_cars', 0)),
-            ("Available Cars", stats.get('available_cars', 0)),
-            ("Booked Cars", stats.get('booked_cars', 0)),
-            ("Total Bookings", stats.get('total_bookings', 0)),
-            ("Active Bookings", stats.get('active_bookings', 0)),
-            ("Total Customers", stats.get('total_customers', 0)),
-            ("Total Revenue", utils.format_currency(stats.get('total_revenue', 0))),
-        ]
+        # Report cards are gridded straight onto the view, below the header
+        view.grid_columnconfigure((0, 1), weight=1)
+        self._report_values = {}
         
-        for i, (label, value) in enumerate(report_data):
+        for i, (label, key) in enumerate(self.REPORT_FIELDS):
             row = i // 2
             col = i % 2
             
-            card_frame = ctk.CTkFrame(report_frame, corner_radius=12)
-            card_frame.grid(row=row, column=col, padx=20, pady=20, sticky="ew")
+            card_frame = ctk.CTkFrame(view, corner_radius=12)
+            card_frame.grid(row=row + 1, column=col, padx=(50, 20) if col == 0 else (20, 50),
+                            pady=20, sticky="ew")
             
             label_widget = ctk.CTkLabel(
                 card_frame,
                 text=label,
-                font=("Roboto", 16, "bold")
+                font=FONTS.label_bold
             )
             label_widget.pack(pady=(20, 5))
             
             value_widget = ctk.CTkLabel(
                 card_frame,
-                text=str(value),
-                font=("Roboto", 24, "bold"),
+                text="...",
+                font=FONTS.title,
                 text_color=Config.PRIMARY_COLOR
             )
             value_widget.pack(pady=(5, 20))
+            self._report_values[key] = value_widget
         
-        report_frame.grid_columnconfigure(0, weight=1)
-        report_frame.grid_columnconfigure(1, weight=1)
+        self._refresh_report_stats()
+    
+    def _refresh_report_stats(self):
+        """Fetch stats off the Tk thread and fill the report cards when they arrive"""
+        future = self._executor.submit(self._fetch_stats)
+        self._poll(future, self._set_report_values)
+    
+    def _set_report_values(self, stats):
+        """Queue stats for the report cards' value labels"""
+        for key in self._report_values:
+            value = stats.get(key, 0)
+            self.queue_stat_update(key, utils.format_currency(value) if key == 'total_revenue' else str(value))
+    
+    def queue_stat_update(self, key, text):
+        """Set a report card's value at the next idle point, together with any others"""
+        self._pending_stats[key] = text
+        if not self._stats_flush_scheduled:
+            self._stats_flush_scheduled = True
+            self.after_idle(self._flush_stats)
+    
+    def _flush_stats(self):
+        """Apply all queued report values in one pass"""
+        self._stats_flush_scheduled = False
+        pending, self._pending_stats = self._pending_stats, {}
+        for key, text in pending.items():
+            value_widget = self._report_values.get(key)
+            if value_widget is not None and value_widget.winfo_exists():
+                value_widget.configure(text=text)
+    
+    def set_user(self, user):
+        """Reuse this dashboard for a newly logged-in admin"""
+        self.user = user
+        self._user_label.configure(text=f"👤 {user.name}")
     
     def handle_logout(self):
-        """Handle logout with proper cleanup"""
+        """Handle logout by hiding the dashboard so the next login can reuse it"""
         if ask_confirmation(self, "Confirm Logout", "Are you sure you want to logout?"):
             try:
-                print(f"Logging out admin: {self.user.email}")
+                logger.info("Logging out admin: %s", self.user.email)
                 
-                # Clear any cached data
+                # Hide the window; its widgets and cached lists stay for the next login
                 self.clear_content()
+                self.withdraw()
                 
-                # Close dashboard window
-                self.destroy()
+                if self._on_logout:
+                    self._on_logout()
                 
             except Exception as e:
-                print(f"Logout error: {e}")
+                logger.exception("Logout error")
                 # Force close even if error occurs
                 try:
                     self.destroy()
@@ -2,22 +2,90 @@
 Reusable UI components for Car Rental System
 """
 import customtkinter as ctk
-from typing import Callable, Optional, List
-from config import Config
+import logging
+from tkinter import ttk
+from typing import Callable, Optional, List, Iterable, Union
+from config import Config, FONTS
+from utils import CURRENCY_FORMAT
+
+logger = logging.getLogger(__name__)
+
+# Theme colors bound once at import, for the widget constructors below and
+# for the dashboards' view builders, which import them from here
+_PRIMARY = Config.PRIMARY_COLOR
+_SECONDARY = Config.SECONDARY_COLOR
+_SUCCESS = Config.SUCCESS_COLOR
+_DANGER = Config.DANGER_COLOR
+_WARNING = Config.WARNING_COLOR
+
+def center_on_screen(window, width: int, height: int, screen_w: int, screen_h: int):
+    """Size a window and center it on a screen of the given size.
+    
+    Callers pass the screen size they read once, so no query is made per call.
+    """
+    x = (screen_w - width) // 2
+    y = (screen_h - height) // 2
+    window.geometry(f"{width}x{height}+{x}+{y}")
+
+class FuturePoller:
+    """Mixin for windows that hand work to an executor.
+    
+    Tk may only be touched from its own thread, so results are collected by
+    checking the future from after() callbacks. Pending checks are tracked
+    and cancelled when the window is destroyed. A task that raised is logged
+    and handed to on_error, so a caller can undo its loading state.
+    """
+    POLL_MS = 50
+    # Pending after() ids by future; created on first use
+    _poll_jobs = None
+    
+    def _poll(self, future, callback, on_error: Optional[Callable] = None):
+        """Call callback with the future's result, on the Tk thread, once it is done"""
+        if self._poll_jobs is None:
+            self._poll_jobs = {}
+        self._poll_jobs.pop(future, None)
+        
+        # Cancelled by an executor shutdown; nobody is waiting for it
+        if future.cancelled():
+            return
+        if not future.done():
+            self._poll_jobs[future] = self.after(
+                self.POLL_MS, lambda: self._poll(future, callback, on_error)
+            )
+            return
+        
+        error = future.exception()
+        if error is not None:
+            logger.error("Background task failed", exc_info=error)
+            if on_error is not None:
+                on_error(error)
+            return
+        callback(future.result())
+    
+    def _cancel_polls(self):
+        """Drop every pending check so none fires against a destroyed window"""
+        if self._poll_jobs:
+            for job in self._poll_jobs.values():
+                self.after_cancel(job)
+            self._poll_jobs.clear()
+    
+    def destroy(self):
+        self._cancel_polls()
+        super().destroy()
 
 class ModernButton(ctk.CTkButton):
     """Modern styled button"""
     def __init__(self, master, text: str, command: Callable, 
-                 color: str = Config.PRIMARY_COLOR, **kwargs):
+                 color: str = _PRIMARY, **kwargs):
         super().__init__(
             master,
             text=text,
             command=command,
             fg_color=color,
-            hover_color=Config.SECONDARY_COLOR,
+            hover_color=_SECONDARY,
             corner_radius=8,
             height=40,
-            font=("Roboto", 14, "bold"),
+            font=FONTS.body_bold,
             **kwargs
         )
 
@@ -29,7 +97,7 @@ class ModernEntry(ctk.CTkEntry):
             placeholder_text=placeholder,
             corner_radius=8,
             height=40,
-            font=("Roboto", 12),
+            font=FONTS.text,
             **kwargs
         )
 
@@ -55,165 +123,422 @@ class ModernFrame(ctk.CTkFrame):
 
 class Card(ctk.CTkFrame):
     """Card component for displaying information"""
-    def __init__(self, master, title: str, value: str, color: str = Config.PRIMARY_COLOR):
+    def __init__(self, master, title: str, value: str, color: str = _PRIMARY):
         super().__init__(master, corner_radius=12, fg_color=color)
         
         # Title
         title_label = ctk.CTkLabel(
             self,
             text=title,
-            font=("Roboto", 14),
+            font=FONTS.body,
             text_color="white"
         )
         title_label.pack(pady=(20, 5))
         
         # Value
-        value_label = ctk.CTkLabel(
+        self.value_label = ctk.CTkLabel(
             self,
             text=value,
-            font=("Roboto", 32, "bold"),
+            font=FONTS.stat,
             text_color="white"
         )
-        value_label.pack(pady=(5, 20))
+        self.value_label.pack(pady=(5, 20))
+    
+    def update_value(self, value: str):
+        """Show a new value without rebuilding the card"""
+        self.value_label.configure(text=value)
+
+class LazyGrid:
+    """Grid of cards in a CTkScrollableFrame, built a few at a time.
+    
+    The first screen plus one screen ahead is built up front and the rest
+    as the user scrolls towards the bottom. Cards are built per_batch per
+    event-loop turn so the window stays responsive. items and cards line
+    up by index; only the first len(cards) items have been built.
+    
+    This is the one place that hooks CTkScrollableFrame's private canvas
+    and scrollbar; requirements.txt pins the CustomTkinter version it was
+    written against.
+    """
+    def __init__(self, scroll: ctk.CTkScrollableFrame, items: Iterable,
+                 build_card: Callable, columns: int, per_screen: int,
+                 per_batch: int, pad: int = 15):
+        self.scroll = scroll
+        self.items = list(items)
+        self.cards = []
+        self._build_card = build_card
+        self._columns = columns
+        self._per_screen = per_screen
+        self._per_batch = per_batch
+        self._pad = pad
+        self._target = 0
+        self._build_pending = False
+        # Batches are scheduled on the window, which outlives the scroll frame
+        self._host = scroll.winfo_toplevel()
+        
+        scroll.grid_columnconfigure(tuple(range(columns)), weight=1, uniform="column")
+        
+        # CTkScrollableFrame wires its canvas straight to its scrollbar;
+        # route that through _on_scrolled to see the scroll position
+        scroll._parent_canvas.configure(yscrollcommand=self._on_scrolled)
+        
+        self._mount(per_screen * 2)
+    
+    def _mount(self, count: int):
+        """Queue count more cards; they are built a batch per event-loop turn"""
+        self._target = min(self._target + count, len(self.items))
+        if not self._build_pending and len(self.cards) < self._target:
+            self._build_pending = True
+            self._host.after(0, self._build_batch)
+    
+    def _build_batch(self):
+        """Build the next few queued cards, then yield back to the Tk loop"""
+        # The grid was thrown away since this batch was scheduled
+        if not self.scroll.winfo_exists():
+            return
+        
+        end = min(len(self.cards) + self._per_batch, self._target)
+        for i in range(len(self.cards), end):
+            card = self._build_card(self.scroll, self.items[i])
+            self._place(card, i)
+            self.cards.append(card)
+        
+        if len(self.cards) < self._target:
+            self._host.after(1, self._build_batch)
+        else:
+            self._build_pending = False
+    
+    def _place(self, card, index: int):
+        """Grid a card at its position"""
+        card.grid(row=index // self._columns, column=index % self._columns,
+                  padx=self._pad, pady=self._pad, sticky="nsew")
+    
+    def _on_scrolled(self, first, last):
+        """Update the scrollbar and build more cards once the end comes into view"""
+        self.scroll._scrollbar.set(first, last)
+        if float(last) > 0.9 and self._target < len(self.items):
+            self._mount(self._per_screen)
+    
+    def replace(self, index: int, item):
+        """Swap in a new item at index, rebuilding its card if it was built"""
+        self.items[index] = item
+        if index < len(self.cards):
+            card = self._build_card(self.scroll, item)
+            self._place(card, index)
+            self.cards[index].destroy()
+            self.cards[index] = card
+    
+    def append(self, item):
+        """Add an item at the end; its card is built once the ones before it are"""
+        self.items.append(item)
+        if self._target == len(self.items) - 1:
+            self._mount(1)
+    
+    def remove(self, index: int):
+        """Drop the item at index and shift the cards after it up one slot"""
+        del self.items[index]
+        if index < self._target:
+            self._target -= 1
+        if index < len(self.cards):
+            self.cards.pop(index).destroy()
+            for i in range(index, len(self.cards)):
+                self._place(self.cards[i], i)
+
+def _mode_color(color):
+    """Pick the entry of a (light, dark) CustomTkinter color for the current appearance mode"""
+    if isinstance(color, (list, tuple)):
+        return color[1] if ctk.get_appearance_mode() == "Dark" else color[0]
+    return color
 
-class DataTable(ctk.CTkScrollableFrame):
-    """Table component for displaying data"""
-    def __init__(self, master, headers: List[str], **kwargs):
+def _labeler(button_text: Union[str, Callable]) -> Callable:
+    """Row label function for a DataTable button_text, fixed or per row"""
+    if callable(button_text):
+        return button_text
+    return lambda _: button_text
+
+class DataTable(ctk.CTkFrame):
+    """Table component for displaying data.
+    
+    Rows are items of a single ttk.Treeview rather than widgets of their own.
+    A row's action button is drawn as a cell holding button_text; clicking
+    that cell runs the row's command. button_text is either one label for
+    every row or a callable giving the label for a row. column_types, if
+    given, has one entry per header and may mark columns as "currency" so
+    callers can pass raw amounts.
+    """
+    ROW_HEIGHT = 32
+    
+    # Cell formatters by column type; other columns are shown with str()
+    COLUMN_FORMATTERS = {'currency': CURRENCY_FORMAT}
+    
+    def __init__(self, master, headers: List[str], column_types: Optional[List[str]] = None,
+                 **kwargs):
+        if column_types is not None and len(column_types) != len(headers):
+            raise ValueError(
+                f"column_types has {len(column_types)} entries for {len(headers)} headers"
+            )
         super().__init__(master, **kwargs)
         self.headers = headers
+        self._formatters = [self.COLUMN_FORMATTERS.get(t, str) for t in column_types] \
+            if column_types else None
         self.rows = []
-        self._create_header()
-    
-    def _create_header(self):
-        """Create table header"""
-        header_frame = ctk.CTkFrame(self, fg_color=Config.PRIMARY_COLOR)
-        header_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
-        
-        for i, header in enumerate(self.headers):
-            label = ctk.CTkLabel(
-                header_frame,
-                text=header,
-                font=("Roboto", 12, "bold"),
-                text_color="white"
-            )
-            label.grid(row=0, column=i, padx=10, pady=10, sticky="w")
+        # Treeview item id -> (action column index, command)
+        self._commands = {}
+        self._create_header(kwargs.get('height'))
+    
+    def _create_header(self, height: Optional[int] = None):
+        """Create the tree with one heading per column"""
+        # ttk does not follow CustomTkinter's theme; take the colors from it
+        # for the current appearance mode so the table matches the frames
+        theme = ctk.ThemeManager.theme
+        background = _mode_color(theme["CTkFrame"]["fg_color"])
+        foreground = _mode_color(theme["CTkLabel"]["text_color"])
+        
+        style = ttk.Style(self)
+        style.configure(
+            "DataTable.Treeview",
+            font=FONTS.small,
+            rowheight=self.ROW_HEIGHT,
+            background=background,
+            fieldbackground=background,
+            foreground=foreground
+        )
+        style.map(
+            "DataTable.Treeview",
+            background=[("selected", _SECONDARY)],
+            foreground=[("selected", "white")]
+        )
+        style.configure(
+            "DataTable.Treeview.Heading",
+            font=FONTS.text_bold,
+            background=_PRIMARY,
+            foreground="white"
+        )
+        
+        columns = [f"c{i}" for i in range(len(self.headers))]
+        self.tree = ttk.Treeview(
+            self,
+            columns=columns,
+            show="headings",
+            style="DataTable.Treeview",
+            height=max(1, height // self.ROW_HEIGHT - 1) if height else 10
+        )
+        
+        for column, header in zip(columns, self.headers):
+            self.tree.heading(column, text=header, anchor="w")
+            self.tree.column(column, anchor="w", width=120, stretch=True)
+        
+        scrollbar = ctk.CTkScrollbar(self, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        
+        scrollbar.pack(side="right", fill="y", padx=(0, 5), pady=5)
+        self.tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        self.tree.bind("<ButtonRelease-1>", self._on_click)
     
-    def add_row(self, data: List[str], button_text: Optional[str] = None, 
+    def add_row(self, data: List[str], button_text: Union[str, Callable, None] = None,
                 button_command: Optional[Callable] = None):
         """Add a row to the table"""
-        row_num = len(self.rows) + 1
+        self.add_rows([data], button_text, [button_command] if button_command else None)
+    
+    def add_rows(self, rows: Iterable[List[str]], button_text: Union[str, Callable, None] = None,
+                 button_commands: Optional[Iterable[Callable]] = None):
+        """Add many rows at once.
         
-        row_frame = ctk.CTkFrame(self, fg_color="transparent")
-        row_frame.grid(row=row_num, column=0, sticky="ew", padx=5, pady=2)
+        button_commands, if given, holds one command per row, in row order.
+        A callable button_text is called with each row's data.
+        """
+        insert = self._insert
+        if not (button_text and button_commands):
+            for data in rows:
+                insert(data)
+            return
         
-        for i, value in enumerate(data):
-            label = ctk.CTkLabel(
-                row_frame,
-                text=str(value),
-                font=("Roboto", 11)
-            )
-            label.grid(row=0, column=i, padx=10, pady=8, sticky="w")
-        
-        # Add action button if provided
-        if button_text and button_command:
-            button = ctk.CTkButton(
-                row_frame,
-                text=button_text,
-                command=button_command,
-                width=80,
-                height=30,
-                corner_radius=6
-            )
-            button.grid(row=0, column=len(data), padx=10, pady=5)
+        label = _labeler(button_text)
+        for data, command in zip(rows, button_commands):
+            insert(data, label(data), command)
+    
+    def set_rows(self, items: Iterable, renderer: Callable,
+                 button_text: Union[str, Callable, None] = None,
+                 button_command: Optional[Callable] = None):
+        """Replace the table's rows with renderer(item) for each item.
+        
+        The tree only draws the rows in view, so a row costs one tree item
+        rather than widgets. button_command, if given, is called with the
+        item to run its action; a callable button_text is called with the
+        item to get its label.
+        """
+        self.clear_rows()
+        if not (button_text and button_command):
+            self.add_rows(map(renderer, items))
+            return
+        
+        label = _labeler(button_text)
+        insert = self._insert
+        for item in items:
+            insert(renderer(item), label(item), lambda i=item: button_command(i))
+    
+    def _insert(self, data: List, button_text: Optional[str] = None,
+                command: Optional[Callable] = None):
+        """Insert one row, formatted by column type, with an action cell if command is given"""
+        formatters = self._formatters
+        if formatters:
+            values = [fmt(value) for fmt, value in zip(formatters, data)]
+        else:
+            values = [str(value) for value in data]
+        if command:
+            values.append(button_text)
         
-        self.rows.append(row_frame)
+        item = self.tree.insert('', 'end', values=values)
+        if command:
+            self._commands[item] = (len(data), command)
+        self.rows.append(item)
+    
+    def _on_click(self, event):
+        """Run a row's command when its action cell is clicked"""
+        if self.tree.identify_region(event.x, event.y) != "cell":
+            return
+        
+        action = self._commands.get(self.tree.identify_row(event.y))
+        if action is None:
+            return
+        
+        # identify_column returns "#1" for the first column
+        column_index, command = action
+        if int(self.tree.identify_column(event.x)[1:]) - 1 == column_index:
+            command()
     
     def clear_rows(self):
         """Clear all rows except header"""
-        for row in self.rows:
-            row.destroy()
+        self.tree.delete(*self.rows)
         self.rows = []
+        self._commands.clear()
 
-class MessageDialog(ctk.CTkToplevel):
-    """Custom message dialog"""
-    def __init__(self, parent, title: str, message: str, type: str = "info"):
-        super().__init__(parent)
+# Message dialog icon for each message type
+_ICON_MAP = {
+    "info": "ℹ️",
+    "success": "✅",
+    "error": "❌",
+    "warning": "⚠️"
+}
+
+class _ReusableDialog(ctk.CTkToplevel):
+    """Modal dialog that hides on close so the same window can be shown again"""
+    def __init__(self, master):
+        super().__init__(master)
+        self.withdraw()
+        self.resizable(False, False)
         
+        self._closed = ctk.BooleanVar(self, value=True)
+        self.protocol("WM_DELETE_WINDOW", self._close)
+    
+    WIDTH = 400
+    HEIGHT = 200
+    
+    def _run(self, parent, title: str):
+        """Show the dialog centered over parent and block until it is closed"""
         self.title(title)
-        self.geometry("400x200")
-        self.resizable(False, False)
         
-        # Center window
+        # Position is set while still withdrawn, so the window is mapped only once
+        x = parent.winfo_rootx() + (parent.winfo_width() - self.WIDTH) // 2
+        y = parent.winfo_rooty() + (parent.winfo_height() - self.HEIGHT) // 2
+        self.geometry(f"{self.WIDTH}x{self.HEIGHT}+{max(x, 0)}+{max(y, 0)}")
         self.transient(parent)
+        self.deiconify()
         self.grab_set()
         
+        self._closed.set(False)
+        self.wait_variable(self._closed)
+    
+    @property
+    def showing(self) -> bool:
+        """True while a call is blocked waiting for this dialog to close"""
+        return not self._closed.get()
+    
+    def _close(self):
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
+
+class MessageDialog(_ReusableDialog):
+    """Custom message dialog"""
+    def __init__(self, master):
+        super().__init__(master)
+        
         # Message frame
         frame = ctk.CTkFrame(self)
         frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Icon and message
-        icon_map = {
-            "info": "ℹ️",
-            "success": "✅",
-            "error": "❌",
-            "warning": "⚠️"
-        }
-        
-        icon_label = ctk.CTkLabel(
+        self.icon_label = ctk.CTkLabel(
             frame,
-            text=icon_map.get(type, "ℹ️"),
-            font=("Roboto", 32)
+            text="",
+            font=FONTS.dialog_icon
         )
-        icon_label.pack(pady=(10, 5))
+        self.icon_label.pack(pady=(10, 5))
         
-        message_label = ctk.CTkLabel(
+        self.message_label = ctk.CTkLabel(
             frame,
-            text=message,
-            font=("Roboto", 14),
+            text="",
+            font=FONTS.body,
             wraplength=350
         )
-        message_label.pack(pady=10)
+        self.message_label.pack(pady=10)
         
         # OK button
         ok_button = ctk.CTkButton(
             frame,
             text="OK",
-            command=self.destroy,
+            command=self._close,
             width=100
         )
         ok_button.pack(pady=10)
+    
+    def show(self, parent, title: str, message: str, type: str = "info"):
+        """Show a message over parent and wait for OK"""
+        self.icon_label.configure(text=_ICON_MAP.get(type, "ℹ️"))
+        self.message_label.configure(text=message)
+        self._run(parent, title)
+
+# One message and one confirm window per app, reused for every call
+_message_dialog: Optional[MessageDialog] = None
+_confirm_dialog: Optional['ConfirmDialog'] = None
 
 def show_message(parent, title: str, message: str, type: str = "info"):
     """Show a message dialog"""
-    dialog = MessageDialog(parent, title, message, type)
-    dialog.wait_window()
+    global _message_dialog
+    if _message_dialog is None or not _message_dialog.winfo_exists():
+        # Owned by the root so it outlives the window that first asked for it
+        _message_dialog = MessageDialog(parent._root())
+    elif _message_dialog.showing:
+        # Asked again while already open (e.g. from a callback run during
+        # its wait); reusing it would overwrite the message being shown
+        dialog = MessageDialog(parent._root())
+        try:
+            dialog.show(parent, title, message, type)
+        finally:
+            dialog.destroy()
+        return
+    _message_dialog.show(parent, title, message, type)
 
-class ConfirmDialog(ctk.CTkToplevel):
+class ConfirmDialog(_ReusableDialog):
     """Custom confirmation dialog"""
-    def __init__(self, parent, title: str, message: str):
-        super().__init__(parent)
+    def __init__(self, master):
+        super().__init__(master)
         
         self.result = False
-        self.title(title)
-        self.geometry("400x200")
-        self.resizable(False, False)
-        
-        # Center window
-        self.transient(parent)
-        self.grab_set()
         
         # Message frame
         frame = ctk.CTkFrame(self)
         frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # Message
-        message_label = ctk.CTkLabel(
+        self.message_label = ctk.CTkLabel(
             frame,
-            text=message,
-            font=("Roboto", 14),
+            text="",
+            font=FONTS.body,
             wraplength=350
         )
-        message_label.pack(pady=30)
+        self.message_label.pack(pady=30)
         
         # Buttons
         button_frame = ctk.CTkFrame(frame, fg_color="transparent")
@@ -224,7 +549,7 @@ class ConfirmDialog(ctk.CTkToplevel):
             text="Yes",
             command=self._on_yes,
             width=100,
-            fg_color=Config.SUCCESS_COLOR
+            fg_color=_SUCCESS
         )
         yes_button.pack(side="left", padx=10)
         
@@ -233,20 +558,35 @@ class ConfirmDialog(ctk.CTkToplevel):
             text="No",
             command=self._on_no,
             width=100,
-            fg_color=Config.DANGER_COLOR
+            fg_color=_DANGER
         )
         no_button.pack(side="left", padx=10)
     
+    def ask(self, parent, title: str, message: str) -> bool:
+        """Show a question over parent and return True if Yes was chosen"""
+        self.result = False
+        self.message_label.configure(text=message)
+        self._run(parent, title)
+        return self.result
+    
     def _on_yes(self):
         self.result = True
-        self.destroy()
+        self._close()
     
     def _on_no(self):
         self.result = False
-        self.destroy()
+        self._close()
 
 def ask_confirmation(parent, title: str, message: str) -> bool:
     """Show a confirmation dialog"""
-    dialog = ConfirmDialog(parent, title, message)
-    parent.wait_window(dialog)
-    return dialog.result
+    global _confirm_dialog
+    if _confirm_dialog is None or not _confirm_dialog.winfo_exists():
+        _confirm_dialog = ConfirmDialog(parent._root())
+    elif _confirm_dialog.showing:
+        # Already waiting on an answer; ask this one in a window of its own
+        dialog = ConfirmDialog(parent._root())
+        try:
+            return dialog.ask(parent, title, message)
+        finally:
+            dialog.destroy()
+    return _confirm_dialog.ask(parent, title, message)
@@ -3,39 +3,469 @@ Customer Dashboard for Car Rental System
 Optimized with bug fixes and improved UI rendering
 """
 import customtkinter as ctk
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from tkcalendar import DateEntry
 from database import Database
 from models import Car, Booking, Payment
 from ui.components import (ModernButton, ModernEntry, ModernLabel, ModernFrame,
-                          Card, DataTable, show_message, ask_confirmation)
-from config import Config
+                          Card, DataTable, FuturePoller, LazyGrid, center_on_screen,
+                          show_message, ask_confirmation,
+                          _PRIMARY, _SECONDARY, _SUCCESS, _DANGER, _WARNING)
+from config import Config, FONTS
 import utils
 
+logger = logging.getLogger(__name__)
 
-class CustomerDashboard(ctk.CTkToplevel):
+
+def _booking_row(booking):
+    """Table row for a booking"""
+    return [
+        booking.booking_id,
+        booking.car_info,
+        utils.format_date(booking.start_date),
+        utils.format_date(booking.end_date),
+        utils.format_currency(booking.total_amount),
+        booking.status
+    ]
+
+
+def _payment_row(payment):
+    """Table row for a payment"""
+    return [
+        payment.payment_id,
+        payment.booking_id,
+        utils.format_currency(payment.amount),
+        utils.format_datetime(payment.payment_date),
+        payment.payment_method,
+        payment.status
+    ]
+
+
+def _with_rows(models, render_row):
+    """Pair each model with its table row, so a cached list is formatted only once"""
+    return [(model, render_row(model)) for model in models]
+
+
+class BookingDialog(ctk.CTkToplevel):
+    """Booking form for a car; hidden on close and reused for the next car"""
+    WIDTH = 500
+    HEIGHT = 600
+    
+    def __init__(self, dashboard):
+        super().__init__(dashboard)
+        self.withdraw()
+        
+        self.dashboard = dashboard
+        self.car = None
+        # (start, end) -> (days, total) for date pairs calculated for self.car
+        self._amount_calcs = {}
+        self._pending_update = None
+        # Car whose booking is being written; the dialog takes one at a time
+        self._placing_car = None
+        
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        
+        # Main form frame
+        form_frame = ctk.CTkScrollableFrame(self)
+        form_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Car info header
+        car_info_frame = ctk.CTkFrame(form_frame, fg_color=_PRIMARY, corner_radius=10)
+        car_info_frame.pack(pady=(0, 20), fill="x")
+        
+        car_icon = ctk.CTkLabel(car_info_frame, text="🚗", font=FONTS.icon)
+        car_icon.pack(pady=(15, 5))
+        
+        self.car_name = ctk.CTkLabel(
+            car_info_frame,
+            text="",
+            font=FONTS.subtitle,
+            text_color="white"
+        )
+        self.car_name.pack()
+        
+        self.car_rate = ctk.CTkLabel(
+            car_info_frame,
+            text="",
+            font=FONTS.body,
+            text_color="white"
+        )
+        self.car_rate.pack(pady=(5, 15))
+        
+        # Date selection frame
+        date_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
+        date_frame.pack(pady=10, fill="x")
+        
+        # Start date
+        start_label = ModernLabel(date_frame, text="Start Date", size=14, bold=True)
+        start_label.pack(anchor="w", pady=(10, 5))
+        
+        self.start_date_entry = DateEntry(
+            date_frame,
+            width=45,
+            background=_PRIMARY,
+            foreground='white',
+            borderwidth=2,
+            date_pattern='dd-mm-yyyy',
+            mindate=datetime.now(),
+            font=FONTS.text
+        )
+        self.start_date_entry.pack(pady=(0, 15), fill="x")
+        
+        # End date
+        end_label = ModernLabel(date_frame, text="End Date", size=14, bold=True)
+        end_label.pack(anchor="w", pady=(10, 5))
+        
+        self.end_date_entry = DateEntry(
+            date_frame,
+            width=45,
+            background=_PRIMARY,
+            foreground='white',
+            borderwidth=2,
+            date_pattern='dd-mm-yyyy',
+            mindate=datetime.now() + timedelta(days=1),
+            font=FONTS.text
+        )
+        self.end_date_entry.pack(pady=(0, 15), fill="x")
+        
+        # Total amount display
+        amount_frame = ctk.CTkFrame(date_frame, fg_color=("gray85", "gray25"), corner_radius=10)
+        amount_frame.pack(pady=20, fill="x")
+        
+        self.amount_label = ctk.CTkLabel(
+            amount_frame,
+            text="Total Amount: ₹0.00",
+            font=FONTS.section,
+            text_color=_SUCCESS
+        )
+        self.amount_label.pack(pady=20)
+        
+        # Bind date change events
+        self.start_date_entry.bind("<<DateEntrySelected>>", self._schedule_update)
+        self.end_date_entry.bind("<<DateEntrySelected>>", self._schedule_update)
+        
+        # Buttons
+        button_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
+        button_frame.pack(pady=30)
+        
+        self.confirm_btn = ctk.CTkButton(
+            button_frame,
+            text="✓ Confirm Booking",
+            command=self._confirm_booking,
+            width=180,
+            height=45,
+            fg_color=_SUCCESS,
+            hover_color="#27ae60",
+            font=FONTS.body_bold,
+            corner_radius=8
+        )
+        self.confirm_btn.pack(side="left", padx=10)
+        
+        cancel_btn = ctk.CTkButton(
+            button_frame,
+            text="✗ Cancel",
+            command=self._close,
+            width=180,
+            height=45,
+            fg_color=_DANGER,
+            hover_color="#c0392b",
+            font=FONTS.body_bold,
+            corner_radius=8
+        )
+        cancel_btn.pack(side="left", padx=10)
+    
+    def show(self, car):
+        """Fill the form for car and show it over the dashboard"""
+        self.car = car
+        self._amount_calcs.clear()
+        
+        self.title(f"Book {car.brand} {car.model}")
+        self.car_name.configure(text=f"{car.brand} {car.model}")
+        self.car_rate.configure(text=f"{utils.format_currency(car.daily_rate)} per day")
+        
+        # Start again from today and tomorrow; the bounds move with the date
+        today = datetime.now()
+        tomorrow = today + timedelta(days=1)
+        self.start_date_entry.configure(mindate=today)
+        self.end_date_entry.configure(mindate=tomorrow)
+        self.start_date_entry.set_date(today)
+        self.end_date_entry.set_date(tomorrow)
+        if self._placing_car is None:
+            self.confirm_btn.configure(state="normal", text="✓ Confirm Booking")
+        else:
+            # An earlier booking is still being written; confirm waits for it
+            self.confirm_btn.configure(state="disabled", text="Processing...")
+        
+        center_on_screen(self, self.WIDTH, self.HEIGHT,
+                         self.dashboard._screen_w, self.dashboard._screen_h)
+        self.transient(self.dashboard)
+        self.deiconify()
+        self.grab_set()
+        
+        # Initial amount calculation
+        self._schedule_update()
+    
+    def _close(self):
+        self.grab_release()
+        self.withdraw()
+    
+    def _update_amount(self):
+        """Calculate and update total amount"""
+        self._pending_update = None
+        try:
+            start = self.start_date_entry.get_date()
+            end = self.end_date_entry.get_date()
+            
+            if end <= start:
+                self.amount_label.configure(
+                    text="⚠️ End date must be after start date",
+                    text_color=_DANGER
+                )
+                return
+            
+            calc = self._amount_calcs.get((start, end))
+            if calc is None:
+                calc = self._amount_calcs[(start, end)] = (
+                    utils.calculate_days(start, end),
+                    utils.calculate_total_amount(self.car.daily_rate, start, end)
+                )
+            days, total = calc
+            self.amount_label.configure(
+                text=f"Total Amount: {utils.format_currency(total)}\n({days} {'day' if days == 1 else 'days'})",
+                text_color=_SUCCESS
+            )
+        except Exception as e:
+            logger.exception("Error calculating amount")
+            self.amount_label.configure(
+                text="Error calculating amount",
+                text_color=_DANGER
+            )
+    
+    def _schedule_update(self, *args):
+        """Recalculate once the date pickers stop firing events"""
+        if self._pending_update is not None:
+            self.after_cancel(self._pending_update)
+        self._pending_update = self.after(50, self._update_amount)
+    
+    def _confirm_booking(self):
+        """Confirm and create booking"""
+        dashboard = self.dashboard
+        car = self.car
+        if self._placing_car is not None:
+            return
+        try:
+            start_date = self.start_date_entry.get_date()
+            end_date = self.end_date_entry.get_date()
+            
+            # Validation
+            if end_date <= start_date:
+                show_message(self, "Error", "End date must be after start date", "error")
+                return
+            
+            if start_date < datetime.now().date():
+                show_message(self, "Error", "Start date cannot be in the past", "error")
+                return
+            
+            # Reuse the amount shown in the dialog if these dates were calculated
+            calc = self._amount_calcs.get((start_date, end_date))
+            if calc is not None:
+                total_amount = calc[1]
+            else:
+                total_amount = utils.calculate_total_amount(car.daily_rate, start_date, end_date)
+            
+            # Create booking
+            booking = Booking(
+                booking_id=dashboard.db.generate_id("BOOK_"),
+                customer_id=dashboard.user.uid,
+                car_id=car.car_id,
+                start_date=datetime(start_date.year, start_date.month, start_date.day),
+                end_date=datetime(end_date.year, end_date.month, end_date.day),
+                total_amount=total_amount,
+                status="Active",
+                customer_name=dashboard.user.name,
+                car_info=f"{car.brand} {car.model}"
+            )
+            
+            # Payment record, written in the same transaction as the booking
+            payment = Payment(
+                payment_id=dashboard.db.generate_id("PAY_"),
+                booking_id=booking.booking_id,
+                amount=total_amount,
+                payment_date=datetime.now(),
+                payment_method="Online",
+                status="Completed"
+            )
+            
+            # The writes run on the executor; the button shows progress meanwhile
+            self.confirm_btn.configure(state="disabled", text="Processing...")
+            self._placing_car = car
+            future = dashboard._executor.submit(dashboard._place_booking, booking, payment)
+            dashboard._poll(future, lambda result: self._booking_placed(car, result),
+                            lambda error: self._booking_placed(car, (False, "Failed to place booking")))
+            
+        except Exception as e:
+            logger.exception("Booking error")
+            show_message(self, "Error", f"Booking error: {str(e)}", "error")
+    
+    def _booking_placed(self, car, result):
+        """Report the outcome of _place_booking for the booking placed for car"""
+        success, message = result
+        self._placing_car = None
+        self.confirm_btn.configure(state="normal", text="✓ Confirm Booking")
+        
+        if self.state() == "withdrawn" or self.car is not car:
+            # The dialog was closed, or reopened for another car, while the
+            # booking was being written; report it without touching the form
+            show_message(self.dashboard, "Success" if success else "Error",
+                         f"{car.brand} {car.model}: {message}",
+                         "success" if success else "error")
+            return
+        
+        if success:
+            show_message(self, "Success", message, "success")
+            self._close()
+            self.dashboard.show_my_bookings()
+        else:
+            show_message(self, "Error", message, "error")
+
+
+class CustomerDashboard(FuturePoller, ctk.CTkToplevel):
     """Customer dashboard window"""
+    # Seconds a fetched bookings or payments list is reused across tabs
+    CACHE_TTL = 30
+    # Car cards built up front (roughly one screen of the three-column grid),
+    # and how many are built per event-loop turn after that
+    CAR_CARDS_PER_SCREEN = 6
+    CAR_CARDS_PER_BATCH = 3
+    
     def __init__(self, parent, user):
         super().__init__(parent)
         
         self.user = user
-        self.db = Database()
+        self.db = Database.get()
+        
+        # The customer's data by name ('home', 'cars', 'bookings', 'payments')
+        # as (fetch time, data); _invalidate_cache drops it after a booking
+        # changes, and bumps the version so loads already running are not stored
+        self._cache = {}
+        self._cache_ver = 0
+        self._cache_lock = threading.Lock()
+        
+        # Loaders for the views' data, run on the executor through _cached.
+        # Bookings and payments come paired with their formatted table rows.
+        self._loaders = {
+            'home': self._fetch_home_data,
+            'cars': self.db.get_available_cars,
+            'bookings': lambda: _with_rows(
+                self.db.get_customer_bookings(self.user.uid), _booking_row),
+            'payments': lambda: _with_rows(
+                self.db.get_customer_payments(self.user.uid), _payment_row),
+        }
+        
+        # Database calls for the views and bookings run here, off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        
+        # Built views by name, as (cache version, build time, frame)
+        self._views = {}
+        # Booking form, built on first use and reused for every car
+        self._booking_dialog = None
+        
+        # Screen size does not change during a session; read it once
+        self._screen_w = self.winfo_screenwidth()
+        self._screen_h = self.winfo_screenheight()
         
         self.title(f"{Config.APP_NAME} - Customer Dashboard")
-        self.geometry(f"{Config.WINDOW_WIDTH}x{Config.WINDOW_HEIGHT}")
         
-        # Center window on screen
+        # Size and center window
         self.center_window()
         
         # Create UI
         self.create_dashboard_ui()
     
+    def _cached(self, name, loader):
+        """Return the cached data for name, calling loader if it is missing or stale"""
+        with self._cache_lock:
+            cached = self._cache.get(name)
+            version = self._cache_ver
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+        
+        data = loader()
+        with self._cache_lock:
+            if self._cache_ver == version:
+                self._cache[name] = (time.monotonic(), data)
+        return data
+    
+    def _peek(self, name):
+        """Return the cached data for name if it is fresh, else None"""
+        with self._cache_lock:
+            cached = self._cache.get(name)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+        return None
+    
+    def _fetch(self, name):
+        """Load name through the cache; a failed load is logged and returns None"""
+        try:
+            return self._cached(name, self._loaders[name])
+        except Exception as e:
+            logger.exception("Error loading %s", name)
+            return None
+    
+    def _fetch_home_data(self):
+        """The home view's booking counts and the table rows of its five newest bookings"""
+        return (
+            self.db.get_customer_booking_stats(self.user.uid),
+            [_booking_row(b) for b in self.db.get_customer_bookings(self.user.uid, limit=5)]
+        )
+    
+    def _invalidate_cache(self):
+        """Drop the cached data after a write"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_ver += 1
+    
+    def _load_async(self, parent, name, render):
+        """Load a view's data on the executor and render it when it arrives.
+        
+        Renders straight away if the data is cached; otherwise a loading label
+        is shown in parent until the result is ready.
+        """
+        data = self._peek(name)
+        if data is not None:
+            render(data)
+            return
+        
+        spinner = ctk.CTkLabel(
+            parent,
+            text="Loading...",
+            font=FONTS.body,
+            text_color="gray"
+        )
+        spinner.pack(pady=50)
+        
+        def finish(data):
+            # The user moved to another view while this was loading
+            if not spinner.winfo_exists():
+                return
+            spinner.destroy()
+            render(data)
+        
+        def failed(error):
+            if spinner.winfo_exists():
+                spinner.configure(text="Failed to load data")
+        
+        self._poll(self._executor.submit(self._fetch, name), finish, failed)
+    
     def center_window(self):
         """Center window on screen"""
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() // 2) - (Config.WINDOW_WIDTH // 2)
-        y = (self.winfo_screenheight() // 2) - (Config.WINDOW_HEIGHT // 2)
-        self.geometry(f'{Config.WINDOW_WIDTH}x{Config.WINDOW_HEIGHT}+{x}+{y}')
+        center_on_screen(self, Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT,
+                         self._screen_w, self._screen_h)
     
     def create_dashboard_ui(self):
         """Create main dashboard UI"""
@@ -55,7 +485,7 @@ class CustomerDashboard(ctk.CTkToplevel):
     
     def create_sidebar(self, parent):
         """Create sidebar navigation"""
-        sidebar = ctk.CTkFrame(parent, width=250, fg_color=Config.PRIMARY_COLOR, corner_radius=0)
+        sidebar = ctk.CTkFrame(parent, width=250, fg_color=_PRIMARY, corner_radius=0)
         sidebar.pack(side="left", fill="y")
         sidebar.pack_propagate(False)
         
@@ -66,26 +496,26 @@ class CustomerDashboard(ctk.CTkToplevel):
         icon_label = ctk.CTkLabel(
             header_frame,
             text="🚗",
-            font=("Roboto", 40)
+            font=FONTS.icon
         )
         icon_label.pack()
         
         title_label = ctk.CTkLabel(
             header_frame,
             text="Customer Portal",
-            font=("Roboto", 18, "bold"),
+            font=FONTS.section,
             text_color="white"
         )
         title_label.pack()
         
         # User info
-        user_frame = ctk.CTkFrame(sidebar, fg_color=Config.SECONDARY_COLOR, corner_radius=10)
+        user_frame = ctk.CTkFrame(sidebar, fg_color=_SECONDARY, corner_radius=10)
         user_frame.pack(pady=20, padx=15, fill="x")
         
         user_label = ctk.CTkLabel(
             user_frame,
             text=f"👤 {self.user.name}",
-            font=("Roboto", 14),
+            font=FONTS.body,
             text_color="white"
         )
         user_label.pack(pady=10, padx=10)
@@ -93,7 +523,7 @@ class CustomerDashboard(ctk.CTkToplevel):
         email_label = ctk.CTkLabel(
             user_frame,
             text=self.user.email,
-            font=("Roboto", 10),
+            font=FONTS.tiny,
             text_color="lightgray"
         )
         email_label.pack(pady=(0, 10), padx=10)
@@ -114,10 +544,10 @@ class CustomerDashboard(ctk.CTkToplevel):
                 command=command,
                 fg_color="transparent",
                 text_color="white",
-                hover_color=Config.SECONDARY_COLOR,
+                hover_color=_SECONDARY,
                 anchor="w",
                 height=45,
-                font=("Roboto", 14)
+                font=FONTS.body
             )
             btn.pack(pady=5, padx=15, fill="x")
         
@@ -126,63 +556,92 @@ class CustomerDashboard(ctk.CTkToplevel):
             sidebar,
             text="🚪 Logout",
             command=self.handle_logout,
-            fg_color=Config.DANGER_COLOR,
+            fg_color=_DANGER,
             hover_color="#c0392b",
             height=45,
-            font=("Roboto", 14, "bold")
+            font=FONTS.body_bold
         )
         logout_btn.pack(side="bottom", pady=20, padx=15, fill="x")
     
     def clear_content(self):
-        """Clear content frame"""
+        """Hide the current view; built views are kept for reuse by _open_view"""
         for widget in self.content_frame.winfo_children():
-            widget.destroy()
+            widget.pack_forget()
     
-    def show_home(self):
-        """Show home/dashboard"""
+    def _open_view(self, name, cached=True):
+        """Switch to a view, reusing its widgets if the data it shows is unchanged.
+        
+        A view of cached data is rebuilt after _invalidate_cache or once
+        CACHE_TTL has passed; with cached=False it is built only once.
+        Returns a fresh frame to build the view into, or None if the pooled
+        view was shown again as is.
+        """
         self.clear_content()
         
+        with self._cache_lock:
+            version = self._cache_ver
+        pooled = self._views.get(name)
+        if pooled is not None:
+            pooled_version, built_at, view = pooled
+            if not cached or (pooled_version == version
+                              and time.monotonic() - built_at < self.CACHE_TTL):
+                view.pack(fill="both", expand=True)
+                return None
+            view.destroy()
+        
+        view = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        view.pack(fill="both", expand=True)
+        self._views[name] = (version, time.monotonic(), view)
+        return view
+    
+    def show_home(self):
+        """Show home/dashboard"""
+        view = self._open_view('home', cached=False)
+        if view is not None:
+            self._build_home(view)
+        
+        # Only the counts and recent rows change; refresh them on every visit
+        data = self._peek('home')
+        if data is not None:
+            self._render_home(data)
+        else:
+            self._poll(self._executor.submit(self._fetch, 'home'), self._render_home)
+    
+    def _build_home(self, view):
+        """Build the home view's widgets once; _render_home fills in the data"""
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text=f"Welcome back, {self.user.name.split()[0]}! 👋",
-            font=("Roboto", 28, "bold"),
-            text_color=Config.PRIMARY_COLOR
+            font=FONTS.header,
+            text_color=_PRIMARY
         )
         header.pack(pady=30, padx=30, anchor="w")
         
-        # Quick stats
-        try:
-            bookings = self.db.get_customer_bookings(self.user.uid)
-            active_bookings = [b for b in bookings if b.status == "Active"]
-            completed_bookings = [b for b in bookings if b.status == "Completed"]
-        except Exception as e:
-            print(f"Error loading bookings: {e}")
-            bookings = []
-            active_bookings = []
-            completed_bookings = []
-        
-        stats_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        # Quick stats; the values are set by _render_home
+        stats_frame = ctk.CTkFrame(view, fg_color="transparent")
         stats_frame.pack(pady=20, padx=30, fill="x")
         
         cards_data = [
-            ("Active Bookings", str(len(active_bookings)), Config.WARNING_COLOR),
-            ("Completed Bookings", str(len(completed_bookings)), Config.SUCCESS_COLOR),
-            ("Total Bookings", str(len(bookings)), Config.PRIMARY_COLOR),
+            ('active', "Active Bookings", _WARNING),
+            ('completed', "Completed Bookings", _SUCCESS),
+            ('total', "Total Bookings", _PRIMARY),
         ]
         
-        for title, value, color in cards_data:
-            card = Card(stats_frame, title, value, color)
+        self._stats_cards = {}
+        for key, title, color in cards_data:
+            card = Card(stats_frame, title, "...", color)
             card.pack(side="left", padx=10, pady=10, fill="both", expand=True)
+            self._stats_cards[key] = card
         
         # Quick actions
-        actions_frame = ModernFrame(self.content_frame)
+        actions_frame = ModernFrame(view)
         actions_frame.pack(pady=20, padx=30, fill="x")
         
         actions_title = ctk.CTkLabel(
             actions_frame,
             text="Quick Actions",
-            font=("Roboto", 18, "bold")
+            font=FONTS.section
         )
         actions_title.pack(pady=20, padx=20, anchor="w")
         
@@ -194,7 +653,7 @@ class CustomerDashboard(ctk.CTkToplevel):
             text="🚗 Browse Available Cars",
             command=self.show_browse_cars,
             width=250,
-            color=Config.SUCCESS_COLOR
+            color=_SUCCESS
         )
         browse_btn.pack(side="left", padx=10)
         
@@ -206,79 +665,78 @@ class CustomerDashboard(ctk.CTkToplevel):
         )
         bookings_btn.pack(side="left", padx=10)
         
-        # Recent bookings
+        # Recent bookings; packed by _render_home only when there are any
+        self._recent_frame = ModernFrame(view)
+        
+        recent_title = ctk.CTkLabel(
+            self._recent_frame,
+            text="Recent Bookings",
+            font=FONTS.section
+        )
+        recent_title.pack(pady=15, padx=20, anchor="w")
+        
+        self._recent_table = DataTable(
+            self._recent_frame,
+            headers=["Booking ID", "Car", "Start Date", "End Date", "Amount", "Status"],
+            height=250
+        )
+        self._recent_table.pack(pady=10, padx=20, fill="both", expand=True)
+        self._home_data = None
+    
+    def _render_home(self, data):
+        """Update the home view's counts and recent bookings"""
+        # Already showing this exact (cached) result
+        if data is not None and data is self._home_data:
+            return
+        self._home_data = data
+        
+        stats, bookings = data or ({'active': 0, 'completed': 0, 'total': 0}, [])
+        for key, card in self._stats_cards.items():
+            card.update_value(str(stats[key]))
+        
+        # Rows come formatted from the 'home' loader
+        self._recent_table.set_rows(bookings, list)
         if bookings:
-            recent_frame = ModernFrame(self.content_frame)
-            recent_frame.pack(pady=20, padx=30, fill="both", expand=True)
-            
-            recent_title = ctk.CTkLabel(
-                recent_frame,
-                text="Recent Bookings",
-                font=("Roboto", 18, "bold")
-            )
-            recent_title.pack(pady=15, padx=20, anchor="w")
-            
-            table = DataTable(
-                recent_frame,
-                headers=["Booking ID", "Car", "Start Date", "End Date", "Amount", "Status"],
-                height=250
-            )
-            table.pack(pady=10, padx=20, fill="both", expand=True)
-            
-            for booking in bookings[:5]:  # Latest 5
-                table.add_row([
-                    booking.booking_id,
-                    booking.car_info,
-                    utils.format_date(booking.start_date),
-                    utils.format_date(booking.end_date),
-                    utils.format_currency(booking.total_amount),
-                    booking.status
-                ])
+            self._recent_frame.pack(pady=20, padx=30, fill="both", expand=True)
+        else:
+            self._recent_frame.pack_forget()
     
     def show_browse_cars(self):
         """Show available cars for booking"""
-        self.clear_content()
+        view = self._open_view('cars')
+        if view is None:
+            return
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="Browse Available Cars",
-            font=("Roboto", 28, "bold"),
-            text_color=Config.PRIMARY_COLOR
+            font=FONTS.header,
+            text_color=_PRIMARY
         )
         header.pack(pady=30, padx=30, anchor="w")
         
         # Cars grid container with scrollable frame
         cars_scroll = ctk.CTkScrollableFrame(
-            self.content_frame,
+            view,
             fg_color="transparent",
-            scrollbar_button_color=Config.PRIMARY_COLOR
+            scrollbar_button_color=_PRIMARY
         )
         cars_scroll.pack(pady=20, padx=30, fill="both", expand=True)
         
-        try:
-            cars = self.db.get_available_cars()
-        except Exception as e:
-            print(f"Error loading cars: {e}")
-            cars = []
-        
+        self._load_async(cars_scroll, 'cars', lambda cars: self._render_cars(cars_scroll, cars))
+    
+    def _render_cars(self, cars_scroll, cars):
+        """Fill the browse grid once the available cars have loaded"""
         if cars:
-            # Create grid of car cards
-            for i, car in enumerate(cars):
-                row = i // 3
-                col = i % 3
-                
-                car_card = self.create_car_card(cars_scroll, car)
-                car_card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
-            
-            # Configure grid weights for responsive layout
-            for i in range(3):
-                cars_scroll.grid_columnconfigure(i, weight=1, uniform="column")
+            LazyGrid(cars_scroll, cars, self.create_car_card, columns=3,
+                     per_screen=self.CAR_CARDS_PER_SCREEN,
+                     per_batch=self.CAR_CARDS_PER_BATCH)
         else:
             no_cars_label = ctk.CTkLabel(
                 cars_scroll,
                 text="No cars available at the moment. Please check back later.",
-                font=("Roboto", 14),
+                font=FONTS.body,
                 text_color="gray"
             )
             no_cars_label.pack(pady=50)
@@ -296,7 +754,7 @@ class CustomerDashboard(ctk.CTkToplevel):
         icon_label = ctk.CTkLabel(
             content,
             text="🚗",
-            font=("Roboto", 50)
+            font=FONTS.icon_large
         )
         icon_label.pack(pady=(10, 5))
         
@@ -304,7 +762,7 @@ class CustomerDashboard(ctk.CTkToplevel):
         name_label = ctk.CTkLabel(
             content,
             text=f"{car.brand} {car.model}",
-            font=("Roboto", 18, "bold")
+            font=FONTS.section
         )
         name_label.pack(pady=5)
         
@@ -323,7 +781,7 @@ class CustomerDashboard(ctk.CTkToplevel):
             detail_label = ctk.CTkLabel(
                 details_frame,
                 text=detail,
-                font=("Roboto", 11),
+                font=FONTS.small,
                 anchor="w"
             )
             detail_label.pack(anchor="w", pady=2)
@@ -332,8 +790,8 @@ class CustomerDashboard(ctk.CTkToplevel):
         price_label = ctk.CTkLabel(
             content,
             text=f"{utils.format_currency(car.daily_rate)}/day",
-            font=("Roboto", 20, "bold"),
-            text_color=Config.SUCCESS_COLOR
+            font=FONTS.subtitle,
+            text_color=_SUCCESS
         )
         price_label.pack(pady=10)
         
@@ -342,10 +800,10 @@ class CustomerDashboard(ctk.CTkToplevel):
             content,
             text="Book Now",
             command=lambda c=car: self.show_booking_dialog(c),
-            fg_color=Config.SUCCESS_COLOR,
+            fg_color=_SUCCESS,
             hover_color="#27ae60",
             height=40,
-            font=("Roboto", 14, "bold"),
+            font=FONTS.body_bold,
             corner_radius=8
         )
         book_btn.pack(pady=(10, 5), fill="x")
@@ -354,237 +812,50 @@ class CustomerDashboard(ctk.CTkToplevel):
     
     def show_booking_dialog(self, car):
         """Show booking dialog for selected car"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title(f"Book {car.brand} {car.model}")
-        dialog.geometry("500x600")
-        dialog.transient(self)
-        dialog.grab_set()
-        
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (500 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (600 // 2)
-        dialog.geometry(f"500x600+{x}+{y}")
-        
-        # Main form frame
-        form_frame = ctk.CTkScrollableFrame(dialog)
-        form_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        # Car info header
-        car_info_frame = ctk.CTkFrame(form_frame, fg_color=Config.PRIMARY_COLOR, corner_radius=10)
-        car_info_frame.pack(pady=(0, 20), fill="x")
-        
-        car_icon = ctk.CTkLabel(car_info_frame, text="🚗", font=("Roboto", 40))
-        car_icon.pack(pady=(15, 5))
-        
-        car_name = ctk.CTkLabel(
-            car_info_frame,
-            text=f"{car.brand} {car.model}",
-            font=("Roboto", 20, "bold"),
-            text_color="white"
-        )
-        car_name.pack()
-        
-        car_rate = ctk.CTkLabel(
-            car_info_frame,
-            text=f"{utils.format_currency(car.daily_rate)} per day",
-            font=("Roboto", 14),
-            text_color="white"
-        )
-        car_rate.pack(pady=(5, 15))
-        
-        # Date selection frame
-        date_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-        date_frame.pack(pady=10, fill="x")
-        
-        # Start date
-        start_label = ModernLabel(date_frame, text="Start Date", size=14, bold=True)
-        start_label.pack(anchor="w", pady=(10, 5))
-        
-        start_date_entry = DateEntry(
-            date_frame,
-            width=45,
-            background=Config.PRIMARY_COLOR,
-            foreground='white',
-            borderwidth=2,
-            date_pattern='dd-mm-yyyy',
-            mindate=datetime.now(),
-            font=("Roboto", 12)
-        )
-        start_date_entry.pack(pady=(0, 15), fill="x")
-        
-        # End date
-        end_label = ModernLabel(date_frame, text="End Date", size=14, bold=True)
-        end_label.pack(anchor="w", pady=(10, 5))
-        
-        end_date_entry = DateEntry(
-            date_frame,
-            width=45,
-            background=Config.PRIMARY_COLOR,
-            foreground='white',
-            borderwidth=2,
-            date_pattern='dd-mm-yyyy',
-            mindate=datetime.now() + timedelta(days=1),
-            font=("Roboto", 12)
-        )
-        end_date_entry.pack(pady=(0, 15), fill="x")
-        
-        # Total amount display
-        amount_frame = ctk.CTkFrame(date_frame, fg_color=("gray85", "gray25"), corner_radius=10)
-        amount_frame.pack(pady=20, fill="x")
-        
-        amount_label = ctk.CTkLabel(
-            amount_frame,
-            text="Total Amount: ₹0.00",
-            font=("Roboto", 18, "bold"),
-            text_color=Config.SUCCESS_COLOR
-        )
-        amount_label.pack(pady=20)
-        
-        def update_amount(*args):
-            """Calculate and update total amount"""
-            try:
-                start = start_date_entry.get_date()
-                end = end_date_entry.get_date()
-                
-                if end <= start:
-                    amount_label.configure(
-                        text="⚠️ End date must be after start date",
-                        text_color=Config.DANGER_COLOR
-                    )
-                    return
-                
-                days = utils.calculate_days(start, end)
-                total = utils.calculate_total_amount(car.daily_rate, start, end)
-                amount_label.configure(
-                    text=f"Total Amount: {utils.format_currency(total)}\n({days} {'day' if days == 1 else 'days'})",
-                    text_color=Config.SUCCESS_COLOR
-                )
-            except Exception as e:
-                print(f"Error calculating amount: {e}")
-                amount_label.configure(
-                    text="Error calculating amount",
-                    text_color=Config.DANGER_COLOR
-                )
-        
-        # Bind date change events
-        start_date_entry.bind("<<DateEntrySelected>>", update_amount)
-        end_date_entry.bind("<<DateEntrySelected>>", update_amount)
-        
-        # Buttons
-        button_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-        button_frame.pack(pady=30)
-        
-        def confirm_booking():
-            """Confirm and create booking"""
-            try:
-                start_date = start_date_entry.get_date()
-                end_date = end_date_entry.get_date()
-                
-                # Validation
-                if end_date <= start_date:
-                    show_message(dialog, "Error", "End date must be after start date", "error")
-                    return
-                
-                if start_date < datetime.now().date():
-                    show_message(dialog, "Error", "Start date cannot be in the past", "error")
-                    return
-                
-                # Check availability
-                if not self.db.check_car_availability(car.car_id, start_date, end_date):
-                    show_message(dialog, "Error", "Car is not available for selected dates", "error")
-                    return
-                
-                # Calculate amount
-                total_amount = utils.calculate_total_amount(car.daily_rate, start_date, end_date)
-                
-                # Create booking
-                booking = Booking(
-                    booking_id=self.db.generate_id("BOOK_"),
-                    customer_id=self.user.uid,
-                    car_id=car.car_id,
-                    start_date=datetime.combine(start_date, datetime.min.time()),
-                    end_date=datetime.combine(end_date, datetime.min.time()),
-                    total_amount=total_amount,
-                    status="Active",
-                    customer_name=self.user.name,
-                    car_info=f"{car.brand} {car.model}"
-                )
-                
-                if self.db.create_booking(booking):
-                    # Create payment record
-                    payment = Payment(
-                        payment_id=self.db.generate_id("PAY_"),
-                        booking_id=booking.booking_id,
-                        amount=total_amount,
-                        payment_date=datetime.now(),
-                        payment_method="Online",
-                        status="Completed"
-                    )
-                    self.db.create_payment(payment)
-                    
-                    show_message(dialog, "Success", "Booking confirmed successfully!", "success")
-                    dialog.destroy()
-                    self.show_my_bookings()
-                else:
-                    show_message(dialog, "Error", "Failed to create booking. Please try again.", "error")
-                
-            except Exception as e:
-                print(f"Booking error: {e}")
-                show_message(dialog, "Error", f"Booking error: {str(e)}", "error")
-        
-        confirm_btn = ctk.CTkButton(
-            button_frame,
-            text="✓ Confirm Booking",
-            command=confirm_booking,
-            width=180,
-            height=45,
-            fg_color=Config.SUCCESS_COLOR,
-            hover_color="#27ae60",
-            font=("Roboto", 14, "bold"),
-            corner_radius=8
-        )
-        confirm_btn.pack(side="left", padx=10)
-        
-        cancel_btn = ctk.CTkButton(
-            button_frame,
-            text="✗ Cancel",
-            command=dialog.destroy,
-            width=180,
-            height=45,
-            fg_color=Config.DANGER_COLOR,
-            hover_color="#c0392b",
-            font=("Roboto", 14, "bold"),
-            corner_radius=8
-        )
-        cancel_btn.pack(side="left", padx=10)
+        # One dialog is built on first use and refilled for each car after that
+        if self._booking_dialog is None or not self._booking_dialog.winfo_exists():
+            self._booking_dialog = BookingDialog(self)
+        self._booking_dialog.show(car)
+    
+    def _place_booking(self, booking, payment):
+        """Write a booking and its payment together (runs on the executor).
         
-        # Initial amount calculation
-        dialog.after(100, update_amount)
+        Availability is checked inside the write's transaction. Returns
+        (success, message) for the dialog to show.
+        """
+        try:
+            success, message = self.db.create_booking_with_payment(booking, payment)
+            if success:
+                self._invalidate_cache()
+            return success, message
+        except Exception as e:
+            logger.exception("Booking error")
+            return False, f"Booking error: {str(e)}"
     
     def show_my_bookings(self):
         """Show customer's bookings"""
-        self.clear_content()
+        view = self._open_view('bookings')
+        if view is None:
+            return
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="My Bookings",
-            font=("Roboto", 28, "bold"),
-            text_color=Config.PRIMARY_COLOR
+            font=FONTS.header,
+            text_color=_PRIMARY
         )
         header.pack(pady=30, padx=30, anchor="w")
         
         # Bookings table
-        bookings_frame = ModernFrame(self.content_frame)
+        bookings_frame = ModernFrame(view)
         bookings_frame.pack(pady=20, padx=30, fill="both", expand=True)
         
-        try:
-            bookings = self.db.get_customer_bookings(self.user.uid)
-        except Exception as e:
-            print(f"Error loading bookings: {e}")
-            bookings = []
-        
+        self._load_async(bookings_frame, 'bookings',
+                         lambda bookings: self._render_bookings(bookings_frame, bookings))
+    
+    def _render_bookings(self, bookings_frame, bookings):
+        """Fill the bookings view once the customer's bookings have loaded"""
         if bookings:
             table = DataTable(
                 bookings_frame,
@@ -593,24 +864,18 @@ class CustomerDashboard(ctk.CTkToplevel):
             )
             table.pack(pady=20, padx=20, fill="both", expand=True)
             
-            for booking in bookings:
-                table.add_row(
-                    [
-                        booking.booking_id,
-                        booking.car_info,
-                        utils.format_date(booking.start_date),
-                        utils.format_date(booking.end_date),
-                        utils.format_currency(booking.total_amount),
-                        booking.status
-                    ],
-                    button_text="Cancel" if booking.status == "Active" else "View",
-                    button_command=lambda b=booking: self.handle_booking_action(b)
-                )
+            # Items are (booking, row) pairs from the 'bookings' loader
+            table.set_rows(
+                bookings,
+                itemgetter(1),
+                button_text=lambda item: "Cancel" if item[0].status == "Active" else "View",
+                button_command=lambda item: self.handle_booking_action(item[0])
+            )
         else:
             no_data_label = ctk.CTkLabel(
                 bookings_frame,
                 text="No bookings found. Browse cars to make your first booking!",
-                font=("Roboto", 14),
+                font=FONTS.body,
                 text_color="gray"
             )
             no_data_label.pack(pady=50)
@@ -620,7 +885,7 @@ class CustomerDashboard(ctk.CTkToplevel):
                 text="Browse Cars",
                 command=self.show_browse_cars,
                 width=200,
-                color=Config.SUCCESS_COLOR
+                color=_SUCCESS
             )
             browse_btn.pack(pady=20)
     
@@ -630,12 +895,13 @@ class CustomerDashboard(ctk.CTkToplevel):
             if ask_confirmation(self, "Cancel Booking", f"Are you sure you want to cancel booking {booking.booking_id}?"):
                 try:
                     if self.db.cancel_booking(booking.booking_id):
+                        self._invalidate_cache()
                         show_message(self, "Success", "Booking cancelled successfully!", "success")
                         self.show_my_bookings()
                     else:
                         show_message(self, "Error", "Failed to cancel booking", "error")
                 except Exception as e:
-                    print(f"Error cancelling booking: {e}")
+                    logger.exception("Error cancelling booking")
                     show_message(self, "Error", f"Error: {str(e)}", "error")
         else:
             self.show_booking_details(booking)
@@ -644,16 +910,10 @@ class CustomerDashboard(ctk.CTkToplevel):
         """Show detailed booking information"""
         dialog = ctk.CTkToplevel(self)
         dialog.title(f"Booking Details - {booking.booking_id}")
-        dialog.geometry("450x550")
+        center_on_screen(dialog, 450, 550, self._screen_w, self._screen_h)
         dialog.transient(self)
         dialog.grab_set()
         
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (450 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (550 // 2)
-        dialog.geometry(f"450x550+{x}+{y}")
-        
         frame = ctk.CTkFrame(dialog)
         frame.pack(fill="both", expand=True, padx=30, pady=30)
         
@@ -661,8 +921,8 @@ class CustomerDashboard(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             frame,
             text="Booking Details",
-            font=("Roboto", 24, "bold"),
-            text_color=Config.PRIMARY_COLOR
+            font=FONTS.title,
+            text_color=_PRIMARY
         )
         title.pack(pady=20)
         
@@ -688,7 +948,7 @@ class CustomerDashboard(ctk.CTkToplevel):
             label_widget = ctk.CTkLabel(
                 detail_container,
                 text=label,
-                font=("Roboto", 12, "bold"),
+                font=FONTS.text_bold,
                 anchor="w"
             )
             label_widget.pack(side="left")
@@ -696,7 +956,7 @@ class CustomerDashboard(ctk.CTkToplevel):
             value_widget = ctk.CTkLabel(
                 detail_container,
                 text=value,
-                font=("Roboto", 12),
+                font=FONTS.text,
                 anchor="e"
             )
             value_widget.pack(side="right")
@@ -712,33 +972,28 @@ class CustomerDashboard(ctk.CTkToplevel):
     
     def show_payment_history(self):
         """Show payment history"""
-        self.clear_content()
+        view = self._open_view('payments')
+        if view is None:
+            return
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="Payment History",
-            font=("Roboto", 28, "bold"),
-            text_color=Config.PRIMARY_COLOR
+            font=FONTS.header,
+            text_color=_PRIMARY
         )
         header.pack(pady=30, padx=30, anchor="w")
         
-        try:
-            # Get customer's bookings to find payments
-            bookings = self.db.get_customer_bookings(self.user.uid)
-            booking_ids = [b.booking_id for b in bookings]
-            
-            # Get all payments and filter
-            all_payments = self.db.get_all_payments()
-            customer_payments = [p for p in all_payments if p.booking_id in booking_ids]
-        except Exception as e:
-            print(f"Error loading payments: {e}")
-            customer_payments = []
-        
         # Payments table
-        payments_frame = ModernFrame(self.content_frame)
+        payments_frame = ModernFrame(view)
         payments_frame.pack(pady=20, padx=30, fill="both", expand=True)
         
+        self._load_async(payments_frame, 'payments',
+                         lambda payments: self._render_payments(payments_frame, payments))
+    
+    def _render_payments(self, payments_frame, customer_payments):
+        """Fill the payments view once the customer's payments have loaded"""
         if customer_payments:
             table = DataTable(
                 payments_frame,
@@ -747,46 +1002,40 @@ class CustomerDashboard(ctk.CTkToplevel):
             )
             table.pack(pady=20, padx=20, fill="both", expand=True)
             
-            for payment in customer_payments:
-                table.add_row([
-                    payment.payment_id,
-                    payment.booking_id,
-                    utils.format_currency(payment.amount),
-                    utils.format_datetime(payment.payment_date),
-                    payment.payment_method,
-                    payment.status
-                ])
+            table.add_rows(row for _, row in customer_payments)
         else:
             no_data_label = ctk.CTkLabel(
                 payments_frame,
                 text="No payment records found",
-                font=("Roboto", 14),
+                font=FONTS.body,
                 text_color="gray"
             )
             no_data_label.pack(pady=50)
     
     def show_profile(self):
         """Show user profile"""
-        self.clear_content()
+        view = self._open_view('profile', cached=False)
+        if view is None:
+            return
         
         # Header
         header = ctk.CTkLabel(
-            self.content_frame,
+            view,
             text="My Profile",
-            font=("Roboto", 28, "bold"),
-            text_color=Config.PRIMARY_COLOR
+            font=FONTS.header,
+            text_color=_PRIMARY
         )
         header.pack(pady=30, padx=30, anchor="w")
         
         # Profile frame
-        profile_frame = ModernFrame(self.content_frame)
+        profile_frame = ModernFrame(view)
         profile_frame.pack(pady=20, padx=30, fill="both", expand=True)
         
         # Profile icon
         icon = ctk.CTkLabel(
             profile_frame,
             text="👤",
-            font=("Roboto", 80)
+            font=FONTS.avatar
         )
         icon.pack(pady=30)
         
@@ -809,7 +1058,7 @@ class CustomerDashboard(ctk.CTkToplevel):
             label_widget = ctk.CTkLabel(
                 detail_frame,
                 text=label,
-                font=("Roboto", 14, "bold"),
+                font=FONTS.body_bold,
                 anchor="w"
             )
             label_widget.pack(side="left")
@@ -817,7 +1066,7 @@ class CustomerDashboard(ctk.CTkToplevel):
             value_widget = ctk.CTkLabel(
                 detail_frame,
                 text=value,
-                font=("Roboto", 14),
+                font=FONTS.body,
                 anchor="e"
             )
             value_widget.pack(side="right")
@@ -825,4 +1074,8 @@ class CustomerDashboard(ctk.CTkToplevel):
     def handle_logout(self):
         """Handle logout"""
         if ask_confirmation(self, "Confirm Logout", "Are you sure you want to logout?"):
+            self._invalidate_cache()
+            # Stop the pending result checks before their futures are cancelled
+            self._cancel_polls()
+            self._executor.shutdown(wait=False, cancel_futures=True)
             self.destroy()
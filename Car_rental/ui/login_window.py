@@ -3,18 +3,32 @@ Login and Registration window for Car Rental System
 Optimized with fullscreen support and proper logout handling
 """
 import customtkinter as ctk
+import logging
+import threading
+from tkinter import TclError
+from concurrent.futures import ThreadPoolExecutor
 from auth import AuthManager
-from ui.components import ModernButton, ModernEntry, ModernLabel, show_message
-from config import Config
+from ui.components import (ModernButton, ModernEntry, ModernLabel, FuturePoller,
+                           center_on_screen, show_message)
+from config import Config, FONTS
 import utils
 
+logger = logging.getLogger(__name__)
 
-class LoginWindow(ctk.CTk):
+# Height the register form needs to show every field without scrolling
+_REGISTER_FORM_HEIGHT = 820
+
+
+class LoginWindow(FuturePoller, ctk.CTk):
     """Main login window"""
     def __init__(self):
         super().__init__()
         
-        self.auth_manager = AuthManager()
+        self.auth_manager = AuthManager.get()
+        # Admin dashboard kept hidden between logins and shown again on re-login
+        self._admin_dashboard = None
+        # Login and registration run here so the window keeps repainting
+        self._executor = ThreadPoolExecutor(max_workers=1)
         self.title(Config.APP_NAME)
         
         # Set theme
@@ -32,46 +46,83 @@ class LoginWindow(ctk.CTk):
         self.bind("<Escape>", self.toggle_fullscreen)
         self.bind("<F11>", self.toggle_fullscreen)
         
-        # Create UI
+        # The brand panel is shared; the forms beside it are built once and
+        # repacked on switch, the register form only when first asked for
+        self.register_frame = None
+        self._build_brand_panel()
+        self._build_login_frame()
         self.create_login_ui()
         
         # Update window to ensure proper rendering
         self.update_idletasks()
+        
+        # Import the dashboards while the login screen sits idle
+        self.after(200, self._prewarm_dashboards)
+    
+    def _prewarm_dashboards(self):
+        """Import the dashboard modules in the background so opening one is quick"""
+        def load():
+            try:
+                import ui.admin_dashboard, ui.customer_dashboard
+            except Exception as e:
+                logger.warning("Dashboard preload error: %s", e)
+        
+        threading.Thread(target=load, daemon=True).start()
     
     def toggle_fullscreen(self, event=None):
         """Toggle fullscreen mode"""
-        current_state = self.attributes('-fullscreen')
-        self.attributes('-fullscreen', not current_state)
+        fullscreen = not self.attributes('-fullscreen')
+        self.attributes('-fullscreen', fullscreen)
         
-        if not current_state:
-            # Entering fullscreen
-            self.geometry(f"{self.screen_width}x{self.screen_height}+0+0")
-        else:
-            # Exiting fullscreen
-            self.geometry(f"{Config.WINDOW_WIDTH}x{Config.WINDOW_HEIGHT}")
+        # Fullscreen ignores geometry; on exit, size and place the window at once
+        if not fullscreen:
             self.center_window()
+        
+        # The register form scrolls only when the window is too short for it
+        if self.register_frame is not None and self._register_scrolls == self._register_fits():
+            self._rebuild_register_form()
     
     def center_window(self):
         """Center the window on screen (for non-fullscreen mode)"""
-        self.update_idletasks()
-        width = Config.WINDOW_WIDTH
-        height = Config.WINDOW_HEIGHT
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f'{width}x{height}+{x}+{y}')
+        center_on_screen(self, Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT,
+                         self.screen_width, self.screen_height)
     
     def create_login_ui(self):
-        """Create login interface"""
-        # Clear window
-        for widget in self.winfo_children():
-            widget.destroy()
-        
-        # Main container
-        main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True)
+        """Show the login interface"""
+        if self.register_frame is not None:
+            self.register_frame.pack_forget()
+        self._show_form(self.login_frame, Config.APP_NAME, "Your trusted car rental partner")
+        self._reset_login_form()
+    
+    def _reset_login_form(self):
+        """Empty the login entries and focus the email field"""
+        self._clear_entries(self.email_entry, self.password_entry)
+        self.email_entry.focus()
+    
+    def create_register_ui(self):
+        """Show the registration interface"""
+        self._ensure_register_built()
+        self.login_frame.pack_forget()
+        self._clear_entries(*self._register_entries)
+        self._show_form(self.register_frame, "Join Us Today", "Start your journey with us")
         
-        # Left side - Image/Branding
-        left_frame = ctk.CTkFrame(main_frame, fg_color=Config.PRIMARY_COLOR, corner_radius=0)
+        # Focus on first field
+        self.reg_name_entry.focus()
+    
+    def _show_form(self, form, title: str, subtitle: str):
+        """Pack form beside the brand panel and retitle the panel for it"""
+        self.brand_title.configure(text=title)
+        self.brand_subtitle.configure(text=subtitle)
+        form.pack(side="right", fill="both", expand=True)
+    
+    def _clear_entries(self, *entries):
+        """Empty entries left over from the last time a form was shown"""
+        for entry in entries:
+            entry.delete(0, "end")
+    
+    def _build_brand_panel(self):
+        """Build the left-side brand panel shared by the login and register forms"""
+        left_frame = ctk.CTkFrame(self, fg_color=Config.PRIMARY_COLOR, corner_radius=0)
         left_frame.pack(side="left", fill="both", expand=True)
         
         # Brand content
@@ -81,38 +132,41 @@ class LoginWindow(ctk.CTk):
         brand_label = ctk.CTkLabel(
             brand_container,
             text="🚗",
-            font=("Roboto", 100)
+            font=FONTS.brand_icon
         )
         brand_label.pack(pady=30)
         
-        title_label = ctk.CTkLabel(
+        # Title and subtitle are set by whichever form is shown
+        self.brand_title = ctk.CTkLabel(
             brand_container,
-            text=Config.APP_NAME,
-            font=("Roboto", 42, "bold"),
+            text="",
+            font=FONTS.brand_title,
             text_color="white"
         )
-        title_label.pack(pady=10)
+        self.brand_title.pack(pady=10)
         
-        subtitle_label = ctk.CTkLabel(
+        self.brand_subtitle = ctk.CTkLabel(
             brand_container,
-            text="Your trusted car rental partner",
-            font=("Roboto", 18),
+            text="",
+            font=FONTS.brand_subtitle,
             text_color="white"
         )
-        subtitle_label.pack(pady=10)
+        self.brand_subtitle.pack(pady=10)
         
         # Fullscreen hint
         hint_label = ctk.CTkLabel(
             brand_container,
             text="Press ESC or F11 to toggle fullscreen",
-            font=("Roboto", 11),
+            font=FONTS.small,
             text_color="lightgray"
         )
         hint_label.pack(pady=(30, 0))
-        
+    
+    def _build_login_frame(self):
+        """Build the login form once; create_login_ui shows it"""
         # Right side - Login form
-        right_frame = ctk.CTkFrame(main_frame, fg_color="white", corner_radius=0)
-        right_frame.pack(side="right", fill="both", expand=True)
+        right_frame = ctk.CTkFrame(self, fg_color="white", corner_radius=0)
+        self.login_frame = right_frame
         
         # Login form container
         form_container = ctk.CTkFrame(right_frame, fg_color="transparent")
@@ -122,59 +176,42 @@ class LoginWindow(ctk.CTk):
         login_title = ctk.CTkLabel(
             form_container,
             text="Welcome Back",
-            font=("Roboto", 32, "bold"),
+            font=FONTS.form_title,
             text_color=Config.PRIMARY_COLOR
         )
-        login_title.pack(pady=(0, 10))
+        login_title.grid(row=0, column=0, pady=(0, 10))
         
         login_subtitle = ctk.CTkLabel(
             form_container,
             text="Sign in to continue",
-            font=("Roboto", 16),
+            font=FONTS.lead,
             text_color="gray"
         )
-        login_subtitle.pack(pady=(0, 40))
+        login_subtitle.grid(row=1, column=0, pady=(0, 40))
         
-        # Email field
-        email_label = ModernLabel(form_container, text="Email Address", size=13, bold=True)
-        email_label.pack(anchor="w", pady=(0, 8))
-        
-        self.email_entry = ModernEntry(
-            form_container,
-            placeholder="Enter your email",
-            width=400
-        )
-        self.email_entry.pack(pady=(0, 25))
-        
-        # Password field
-        password_label = ModernLabel(form_container, text="Password", size=13, bold=True)
-        password_label.pack(anchor="w", pady=(0, 8))
-        
-        self.password_entry = ModernEntry(
-            form_container,
-            placeholder="Enter your password",
-            show="•",
-            width=400
-        )
-        self.password_entry.pack(pady=(0, 40))
+        # Email and password fields
+        self.email_entry, self.password_entry = self._grid_fields(form_container, 2, [
+            ("Email Address", "Enter your email", "", 25),
+            ("Password", "Enter your password", "•", 40),
+        ])
         
         # Login button
-        login_btn = ModernButton(
+        self.login_btn = ModernButton(
             form_container,
             text="Login",
             command=self.handle_login,
             width=400
         )
-        login_btn.pack(pady=(0, 25))
+        self.login_btn.grid(row=6, column=0, pady=(0, 25))
         
         # Register link
         register_frame = ctk.CTkFrame(form_container, fg_color="transparent")
-        register_frame.pack()
+        register_frame.grid(row=7, column=0)
         
         register_label = ctk.CTkLabel(
             register_frame,
             text="Don't have an account?",
-            font=("Roboto", 13),
+            font=FONTS.link,
             text_color="gray"
         )
         register_label.pack(side="left", padx=(0, 8))
@@ -188,73 +225,52 @@ class LoginWindow(ctk.CTk):
             hover_color="#e8f4f8",
             width=90,
             height=35,
-            font=("Roboto", 13, "bold")
+            font=FONTS.button
         )
         register_btn.pack(side="left")
         
         # Bind Enter key
-        self.email_entry.bind("<Return>", lambda e: self.password_entry.focus())
-        self.password_entry.bind("<Return>", lambda e: self.handle_login())
-        
-        # Focus on email field
-        self.email_entry.focus()
+        self.email_entry.bind("<Return>", self._focus_password)
+        self.password_entry.bind("<Return>", self._submit_login)
     
-    def create_register_ui(self):
-        """Create registration interface"""
-        # Clear window
-        for widget in self.winfo_children():
-            widget.destroy()
-        
-        # Main container
-        main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True)
-        
-        # Left side - Image/Branding
-        left_frame = ctk.CTkFrame(main_frame, fg_color=Config.PRIMARY_COLOR, corner_radius=0)
-        left_frame.pack(side="left", fill="both", expand=True)
-        
-        # Brand content
-        brand_container = ctk.CTkFrame(left_frame, fg_color="transparent")
-        brand_container.place(relx=0.5, rely=0.5, anchor="center")
-        
-        brand_label = ctk.CTkLabel(
-            brand_container,
-            text="🚗",
-            font=("Roboto", 100)
-        )
-        brand_label.pack(pady=30)
-        
-        title_label = ctk.CTkLabel(
-            brand_container,
-            text="Join Us Today",
-            font=("Roboto", 42, "bold"),
-            text_color="white"
-        )
-        title_label.pack(pady=10)
-        
-        subtitle_label = ctk.CTkLabel(
-            brand_container,
-            text="Start your journey with us",
-            font=("Roboto", 18),
-            text_color="white"
-        )
-        subtitle_label.pack(pady=10)
+    def _register_fits(self) -> bool:
+        """Whether the register form fits the window without scrolling"""
+        return bool(self.attributes('-fullscreen')) and self.screen_height >= _REGISTER_FORM_HEIGHT
+    
+    def _rebuild_register_form(self):
+        """Drop the register form so it is rebuilt for the current window size.
+        
+        If it is on screen it is rebuilt right away, keeping what was typed.
+        """
+        shown = self.register_frame.winfo_ismapped()
+        values = [entry.get() for entry in self._register_entries]
+        self.register_frame.destroy()
+        self.register_frame = None
+        if not shown:
+            return
         
-        # Fullscreen hint
-        hint_label = ctk.CTkLabel(
-            brand_container,
-            text="Press ESC or F11 to toggle fullscreen",
-            font=("Roboto", 11),
-            text_color="lightgray"
-        )
-        hint_label.pack(pady=(30, 0))
+        self._ensure_register_built()
+        self.register_frame.pack(side="right", fill="both", expand=True)
+        for entry, value in zip(self._register_entries, values):
+            if value:
+                entry.insert(0, value)
+    
+    def _ensure_register_built(self):
+        """Build the registration form on first use; create_register_ui shows it"""
+        if self.register_frame is not None:
+            return
         
         # Right side - Registration form
-        right_frame = ctk.CTkFrame(main_frame, fg_color="white", corner_radius=0)
-        right_frame.pack(side="right", fill="both", expand=True)
-        
-        # Scrollable form container
-        form_scroll = ctk.CTkScrollableFrame(right_frame, fg_color="transparent")
+        right_frame = ctk.CTkFrame(self, fg_color="white", corner_radius=0)
+        self.register_frame = right_frame
+        
+        # Form container; a scrollable frame costs a canvas and scrollbar,
+        # so it is only used when the form would not fit
+        self._register_scrolls = not self._register_fits()
+        if self._register_scrolls:
+            form_scroll = ctk.CTkScrollableFrame(right_frame, fg_color="transparent")
+        else:
+            form_scroll = ctk.CTkFrame(right_frame, fg_color="transparent")
         form_scroll.pack(fill="both", expand=True, padx=80, pady=60)
         
         # Center content
@@ -265,96 +281,40 @@ class LoginWindow(ctk.CTk):
         register_title = ctk.CTkLabel(
             form_container,
             text="Create Account",
-            font=("Roboto", 32, "bold"),
+            font=FONTS.form_title,
             text_color=Config.PRIMARY_COLOR
         )
-        register_title.pack(pady=(0, 40))
-        
-        # Name field
-        name_label = ModernLabel(form_container, text="Full Name *", size=13, bold=True)
-        name_label.pack(anchor="w", pady=(0, 8))
-        
-        self.reg_name_entry = ModernEntry(
-            form_container,
-            placeholder="Enter your full name",
-            width=400
-        )
-        self.reg_name_entry.pack(pady=(0, 20))
-        
-        # Email field
-        email_label = ModernLabel(form_container, text="Email Address *", size=13, bold=True)
-        email_label.pack(anchor="w", pady=(0, 8))
-        
-        self.reg_email_entry = ModernEntry(
-            form_container,
-            placeholder="Enter your email",
-            width=400
-        )
-        self.reg_email_entry.pack(pady=(0, 20))
-        
-        # Phone field
-        phone_label = ModernLabel(form_container, text="Phone Number *", size=13, bold=True)
-        phone_label.pack(anchor="w", pady=(0, 8))
-        
-        self.reg_phone_entry = ModernEntry(
-            form_container,
-            placeholder="Enter 10-digit phone number",
-            width=400
-        )
-        self.reg_phone_entry.pack(pady=(0, 20))
-        
-        # Address field
-        address_label = ModernLabel(form_container, text="Address *", size=13, bold=True)
-        address_label.pack(anchor="w", pady=(0, 8))
-        
-        self.reg_address_entry = ModernEntry(
-            form_container,
-            placeholder="Enter your address",
-            width=400
-        )
-        self.reg_address_entry.pack(pady=(0, 20))
-        
-        # Password field
-        password_label = ModernLabel(form_container, text="Password *", size=13, bold=True)
-        password_label.pack(anchor="w", pady=(0, 8))
-        
-        self.reg_password_entry = ModernEntry(
-            form_container,
-            placeholder="Create a password (min 6 characters)",
-            show="•",
-            width=400
-        )
-        self.reg_password_entry.pack(pady=(0, 20))
-        
-        # Confirm Password field
-        confirm_label = ModernLabel(form_container, text="Confirm Password *", size=13, bold=True)
-        confirm_label.pack(anchor="w", pady=(0, 8))
-        
-        self.reg_confirm_entry = ModernEntry(
-            form_container,
-            placeholder="Confirm your password",
-            show="•",
-            width=400
-        )
-        self.reg_confirm_entry.pack(pady=(0, 35))
+        register_title.grid(row=0, column=0, pady=(0, 40))
+        
+        # Form fields
+        self._register_entries = self._grid_fields(form_container, 1, [
+            ("Full Name *", "Enter your full name", "", 20),
+            ("Email Address *", "Enter your email", "", 20),
+            ("Phone Number *", "Enter 10-digit phone number", "", 20),
+            ("Address *", "Enter your address", "", 20),
+            ("Password *", "Create a password (min 6 characters)", "•", 20),
+            ("Confirm Password *", "Confirm your password", "•", 35),
+        ])
+        (self.reg_name_entry, self.reg_email_entry, self.reg_phone_entry,
+         self.reg_address_entry, self.reg_password_entry, self.reg_confirm_entry) = self._register_entries
         
         # Register button
-        register_btn = ModernButton(
+        self.register_btn = ModernButton(
             form_container,
             text="Create Account",
             command=self.handle_register,
             width=400
         )
-        register_btn.pack(pady=(0, 25))
+        self.register_btn.grid(row=13, column=0, pady=(0, 25))
         
         # Login link
         login_frame = ctk.CTkFrame(form_container, fg_color="transparent")
-        login_frame.pack()
+        login_frame.grid(row=14, column=0)
         
         login_label = ctk.CTkLabel(
             login_frame,
             text="Already have an account?",
-            font=("Roboto", 13),
+            font=FONTS.link,
             text_color="gray"
         )
         login_label.pack(side="left", padx=(0, 8))
@@ -368,15 +328,40 @@ class LoginWindow(ctk.CTk):
             hover_color="#e8f4f8",
             width=90,
             height=35,
-            font=("Roboto", 13, "bold")
+            font=FONTS.button
         )
         login_btn.pack(side="left")
-        
-        # Focus on first field
-        self.reg_name_entry.focus()
+    
+    def _grid_fields(self, form_container, row, fields):
+        """Grid a label and an entry for each (label, placeholder, show, gap) field.
+        
+        Fields take two rows each from row on; gap is the space below the entry.
+        Returns the entries in field order.
+        """
+        entries = []
+        for label_text, placeholder, show, gap in fields:
+            label = ModernLabel(form_container, text=label_text, size=13, bold=True)
+            label.grid(row=row, column=0, sticky="w", pady=(0, 8))
+            
+            entry = ModernEntry(form_container, placeholder=placeholder, show=show, width=400)
+            entry.grid(row=row + 1, column=0, pady=(0, gap))
+            entries.append(entry)
+            row += 2
+        return tuple(entries)
+    
+    def _focus_password(self, event=None):
+        """Move from the email field to the password field on Enter"""
+        self.password_entry.focus()
+    
+    def _submit_login(self, event=None):
+        """Log in on Enter in the password field"""
+        self.handle_login()
     
     def handle_login(self):
         """Handle login action"""
+        if self.login_btn.cget("state") == "disabled":
+            return  # A login is already in flight
+        
         email = self.email_entry.get().strip()
         password = self.password_entry.get()
         
@@ -389,52 +374,80 @@ class LoginWindow(ctk.CTk):
             show_message(self, "Error", "Please enter a valid email address", "error")
             return
         
-        # Attempt login
+        # Attempt login off the Tk thread
+        self.login_btn.configure(state="disabled")
+        self._poll(self._executor.submit(self._do_login, email, password), self._finish_login,
+                   lambda error: self._finish_login((False, "Login failed", None)))
+    
+    def _do_login(self, email, password):
+        """Run the login on the worker thread; returns (success, message, user)"""
         try:
-            success, message, user = self.auth_manager.login(email, password)
-            
-            if success:
-                show_message(self, "Success", "Login successful!", "success")
-                self.open_dashboard(user)
-            else:
-                show_message(self, "Error", message, "error")
+            return self.auth_manager.login(email, password)
         except Exception as e:
-            print(f"Login error: {e}")
-            show_message(self, "Error", f"Login failed: {str(e)}", "error")
+            logger.error("Login error: %s", e)
+            return False, f"Login failed: {str(e)}", None
+    
+    def _finish_login(self, result):
+        """Report the login result on the Tk thread"""
+        success, message, user = result
+        self.login_btn.configure(state="normal")
+        
+        if success:
+            show_message(self, "Success", "Login successful!", "success")
+            self.open_dashboard(user)
+        else:
+            show_message(self, "Error", message, "error")
     
     def handle_register(self):
         """Handle registration action"""
-        name = self.reg_name_entry.get().strip()
-        email = self.reg_email_entry.get().strip()
-        phone = self.reg_phone_entry.get().strip()
-        address = self.reg_address_entry.get().strip()
-        password = self.reg_password_entry.get()
-        confirm_password = self.reg_confirm_entry.get()
+        if self.register_btn.cget("state") == "disabled":
+            return  # A registration is already in flight
+        
+        entries = self._register_entries
+        values = [entry.get() for entry in entries]
+        # Passwords are taken as typed; the other fields are stripped
+        name, email, phone, address = (value.strip() for value in values[:4])
+        password, confirm_password = values[4:]
+        
+        # Validation, cheapest checks first; the first failing field gets focus
+        for entry, value in zip(entries, (name, email, phone, address, password, confirm_password)):
+            if not value:
+                show_message(self, "Error", "Please fill all required fields", "error")
+                entry.focus()
+                return
         
-        # Validation
-        if not all([name, email, phone, address, password, confirm_password]):
-            show_message(self, "Error", "Please fill all required fields", "error")
+        if len(password) < 6:
+            show_message(self, "Error", "Password must be at least 6 characters long", "error")
+            self.reg_password_entry.focus()
+            return
+        
+        if password != confirm_password:
+            show_message(self, "Error", "Passwords do not match", "error")
+            self.reg_confirm_entry.focus()
             return
         
         if not utils.validate_email(email):
             show_message(self, "Error", "Please enter a valid email address", "error")
+            self.reg_email_entry.focus()
             return
         
         if not utils.validate_phone(phone):
             show_message(self, "Error", "Please enter a valid 10-digit phone number starting with 6-9", "error")
+            self.reg_phone_entry.focus()
             return
         
-        if len(password) < 6:
-            show_message(self, "Error", "Password must be at least 6 characters long", "error")
-            return
-        
-        if password != confirm_password:
-            show_message(self, "Error", "Passwords do not match", "error")
-            return
-        
-        # Attempt registration
+        # Attempt registration off the Tk thread
+        self.register_btn.configure(state="disabled")
+        future = self._executor.submit(
+            self._do_register, email, password, name, phone, address
+        )
+        self._poll(future, self._finish_register,
+                   lambda error: self._finish_register((False, "Registration failed")))
+    
+    def _do_register(self, email, password, name, phone, address):
+        """Run the registration on the worker thread; returns (success, message)"""
         try:
-            success, message = self.auth_manager.register_user(
+            return self.auth_manager.register_user(
                 email=email,
                 password=password,
                 name=name,
@@ -442,15 +455,20 @@ class LoginWindow(ctk.CTk):
                 phone=phone,
                 address=address
             )
-            
-            if success:
-                show_message(self, "Success", "Registration successful! Please login.", "success")
-                self.create_login_ui()
-            else:
-                show_message(self, "Error", message, "error")
         except Exception as e:
-            print(f"Registration error: {e}")
-            show_message(self, "Error", f"Registration failed: {str(e)}", "error")
+            logger.error("Registration error: %s", e)
+            return False, f"Registration failed: {str(e)}"
+    
+    def _finish_register(self, result):
+        """Report the registration result on the Tk thread"""
+        success, message = result
+        self.register_btn.configure(state="normal")
+        
+        if success:
+            show_message(self, "Success", "Registration successful! Please login.", "success")
+            self.create_login_ui()
+        else:
+            show_message(self, "Error", message, "error")
     
     def open_dashboard(self, user):
         """Open appropriate dashboard based on user role"""
@@ -458,8 +476,19 @@ class LoginWindow(ctk.CTk):
             self.withdraw()  # Hide login window
             
             if user.role == "admin":
+                dashboard = self._admin_dashboard
+                if dashboard is not None and dashboard.winfo_exists():
+                    dashboard.set_user(user)
+                    dashboard.deiconify()
+                    dashboard.attributes('-fullscreen', True)
+                    dashboard.show_home()
+                    return
+                
                 from ui.admin_dashboard import AdminDashboard
-                dashboard = AdminDashboard(self, user)
+                dashboard = AdminDashboard(
+                    self, user, on_logout=lambda: self.on_dashboard_close(self._admin_dashboard)
+                )
+                self._admin_dashboard = dashboard
             else:
                 from ui.customer_dashboard import CustomerDashboard
                 dashboard = CustomerDashboard(self, user)
@@ -475,46 +504,45 @@ class LoginWindow(ctk.CTk):
             dashboard.bind("<F11>", lambda e: self.toggle_dashboard_fullscreen(dashboard))
             
         except Exception as e:
-            print(f"Error opening dashboard: {e}")
+            logger.error("Error opening dashboard: %s", e)
             show_message(self, "Error", f"Failed to open dashboard: {str(e)}", "error")
             self.deiconify()
     
     def toggle_dashboard_fullscreen(self, dashboard):
         """Toggle fullscreen for dashboard"""
         try:
-            current_state = dashboard.attributes('-fullscreen')
-            dashboard.attributes('-fullscreen', not current_state)
+            fullscreen = not dashboard.attributes('-fullscreen')
+            dashboard.attributes('-fullscreen', fullscreen)
             
-            if not current_state:
-                # Entering fullscreen
-                dashboard.geometry(f"{self.screen_width}x{self.screen_height}+0+0")
-            else:
-                # Exiting fullscreen
-                dashboard.geometry(f"{Config.WINDOW_WIDTH}x{Config.WINDOW_HEIGHT}")
-                dashboard.update_idletasks()
-                x = (dashboard.winfo_screenwidth() // 2) - (Config.WINDOW_WIDTH // 2)
-                y = (dashboard.winfo_screenheight() // 2) - (Config.WINDOW_HEIGHT // 2)
-                dashboard.geometry(f"{Config.WINDOW_WIDTH}x{Config.WINDOW_HEIGHT}+{x}+{y}")
-        except Exception as e:
-            print(f"Error toggling fullscreen: {e}")
+            # Fullscreen ignores geometry; on exit, size and place the window at once
+            if not fullscreen:
+                center_on_screen(dashboard, Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT,
+                                 self.screen_width, self.screen_height)
+        except TclError as e:
+            # The dashboard window was destroyed under the key press
+            logger.warning("Error toggling fullscreen: %s", e)
     
     def on_dashboard_close(self, dashboard):
         """Handle dashboard window close"""
         try:
             # Logout user
             self.auth_manager.logout()
-            print("User logged out successfully")
+            logger.info("User logged out successfully")
             
-            # Destroy dashboard
-            dashboard.destroy()
+            # Hide the admin dashboard for reuse; other dashboards are destroyed
+            if dashboard is self._admin_dashboard:
+                dashboard.withdraw()
+            else:
+                dashboard.destroy()
             
-            # Show login window again in fullscreen
+            # Show the login window again in fullscreen; its screen is
+            # still packed from before login, so only the entries are reset
             self.deiconify()
             self.attributes('-fullscreen', True)
-            self.create_login_ui()
+            self._reset_login_form()
             
         except Exception as e:
-            print(f"Error during logout: {e}")
+            logger.error("Error during logout: %s", e)
             # Force cleanup
             try:
                 dashboard.destroy()
@@ -522,4 +550,4 @@ class LoginWindow(ctk.CTk):
                 pass
             self.deiconify()
             self.attributes('-fullscreen', True)
-            self.create_login_ui()
+            self._reset_login_form()
@@ -1,46 +1,80 @@
 """
 Utility functions for Car Rental System
 """
+import re
 from datetime import datetime, timedelta
-from typing import Tuple
+from functools import lru_cache
+from typing import Tuple, Iterable, List
+
+# Email validation pattern, compiled once at import. It also keeps '/' out,
+# since emails double as Firestore document IDs in the emails/ index.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 def calculate_days(start_date: datetime, end_date: datetime) -> int:
-    """Calculate number of days between two dates"""
-    delta = end_date - start_date
-    return max(1, delta.days)  # Minimum 1 day
+    """Calculate number of calendar days between two dates (minimum 1 day).
+    
+    Datetimes are truncated to their date first, so the time of day is
+    ignored: 10 Jan 23:00 to 12 Jan 01:00 counts as two days. Plain dates
+    are accepted as well.
+    """
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    if isinstance(end_date, datetime):
+        end_date = end_date.date()
+    days = (end_date - start_date).days
+    return days if days > 1 else 1
+
+def to_paise(amount: float) -> int:
+    """Convert a rupee amount to whole paise"""
+    return round(amount * 100)
 
 def calculate_total_amount(daily_rate: float, start_date: datetime, end_date: datetime) -> float:
-    """Calculate total rental amount"""
+    """Calculate total rental amount (multiplied in whole paise, so it is exact)"""
     days = calculate_days(start_date, end_date)
-    return daily_rate * days
+    return to_paise(daily_rate) * days / 100
+
+# Bound str.format for currency; reusable wherever many amounts are formatted
+CURRENCY_FORMAT = "₹{:,.2f}".format
 
+@lru_cache(maxsize=4096)
 def format_currency(amount: float) -> str:
-    """Format amount as currency"""
-    return f"₹{amount:,.2f}"
+    """Format amount as currency (memoized; rates and totals repeat a lot)"""
+    return CURRENCY_FORMAT(amount)
+
+def format_currency_all(amounts: Iterable[float]) -> List[str]:
+    """Format many amounts as currency in one call"""
+    return list(map(CURRENCY_FORMAT, amounts))
+
+@lru_cache(maxsize=2048)
+def _strftime(date: datetime, tzinfo, fmt: str) -> str:
+    """Memoized strftime. tzinfo is part of the key because datetimes in
+    different zones compare equal when they are the same instant."""
+    return date.strftime(fmt)
 
 def format_date(date: datetime) -> str:
     """Format datetime to readable string"""
-    return date.strftime("%d-%m-%Y")
+    return _strftime(date, date.tzinfo, "%d-%m-%Y")
+
+def format_date_all(dates: Iterable[datetime]) -> List[str]:
+    """Format many datetimes to readable strings in one call"""
+    return [date.strftime("%d-%m-%Y") for date in dates]
 
 def format_datetime(date: datetime) -> str:
     """Format datetime with time"""
-    return date.strftime("%d-%m-%Y %I:%M %p")
+    return _strftime(date, date.tzinfo, "%d-%m-%Y %I:%M %p")
 
 def parse_date(date_str: str) -> datetime:
-    """Parse date string to datetime"""
+    """Parse a DD-MM-YYYY date string to datetime, or now() if it is not one"""
     try:
         return datetime.strptime(date_str, "%d-%m-%Y")
-    except:
+    except (ValueError, TypeError):
+        # Malformed or out-of-range date, or not a string at all
         return datetime.now()
 
 def validate_email(email: str) -> bool:
     """Validate email format"""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 def validate_phone(phone: str) -> bool:
-    """Validate phone number (Indian format)"""
-    import re
-    pattern = r'^[6-9]\d{9}$'
-    return re.match(pattern, phone) is not None
+    """Validate phone number (Indian format: 10 ASCII digits starting with 6-9)"""
+    return len(phone) == 10 and phone.isascii() and phone.isdigit() and phone[0] >= '6'